@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from datetime import datetime
 from enum import Enum, auto
-from typing import Iterable, List, Literal, Optional
+from typing import Iterable, Iterator, List, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 
@@ -44,10 +44,13 @@ STB_OSD_MARKERS = (
 )
 
 BRAND_REGEX = re.compile(r'"brand"\s*:\s*"([^"]+)"', re.IGNORECASE)
+# Each regex is paired with a literal that must appear in the lower-cased line
+# for the regex to possibly match; the substring test is far cheaper than a
+# regex search and rules out the vast majority of logcat lines.
 VOLUME_SOURCE_REGEXES = (
-    re.compile(r'"volume_source"\s*:\s*(?P<value>"[^"]+"|\d+)', re.IGNORECASE),
-    re.compile(r'curvolsource\s*[:=]\s*(?P<num>\d+)', re.IGNORECASE),
-    re.compile(r'current_volume_source[^\d]*(?P<num>\d+)', re.IGNORECASE),
+    ('"volume_source"', re.compile(r'"volume_source"\s*:\s*(?P<value>"[^"]+"|\d+)', re.IGNORECASE)),
+    ("curvolsource", re.compile(r'curvolsource\s*[:=]\s*(?P<num>\d+)', re.IGNORECASE)),
+    ("current_volume_source", re.compile(r'current_volume_source[^\d]*(?P<num>\d+)', re.IGNORECASE)),
 )
 TV_DEVICE_REGEX = re.compile(r'tv[_ ]?device[_ ]?name[^A-Za-z0-9]*(?P<value>[^,;]+)', re.IGNORECASE)
 IS_TV_SETUP_REGEX = re.compile(r'is[_ ]?tv[_ ]?setup\s*[:=]\s*(true|false)', re.IGNORECASE)
@@ -146,8 +149,10 @@ def _normalize_volume_source(value: str) -> Optional[str]:
     return None
 
 
-def _extract_volume_source(line: str) -> Optional[str]:
-    for regex in VOLUME_SOURCE_REGEXES:
+def _extract_volume_source(line: str, lower: str) -> Optional[str]:
+    for needle, regex in VOLUME_SOURCE_REGEXES:
+        if needle not in lower:
+            continue
         match = regex.search(line)
         if not match:
             continue
@@ -160,7 +165,9 @@ def _extract_volume_source(line: str) -> Optional[str]:
     return None
 
 
-def _maybe_extract_brand(line: str) -> Optional[str]:
+def _maybe_extract_brand(line: str, lower: str) -> Optional[str]:
+    if '"brand"' not in lower:
+        return None
     match = BRAND_REGEX.search(line)
     if not match:
         return None
@@ -170,14 +177,18 @@ def _maybe_extract_brand(line: str) -> Optional[str]:
     return candidate
 
 
-def _maybe_extract_tv_device(line: str) -> Optional[str]:
+def _maybe_extract_tv_device(line: str, lower: str) -> Optional[str]:
+    if "device" not in lower:
+        return None
     match = TV_DEVICE_REGEX.search(line)
     if not match:
         return None
     return match.group("value").strip().strip('"')
 
 
-def _maybe_extract_is_tv_setup(line: str) -> Optional[bool]:
+def _maybe_extract_is_tv_setup(line: str, lower: str) -> Optional[bool]:
+    if "setup" not in lower:
+        return None
     match = IS_TV_SETUP_REGEX.search(line)
     if not match:
         return None
@@ -218,33 +229,57 @@ def _update_volume_sources(signals: QuicksetLogSignals, source: str) -> None:
         signals.stb_volume_events += 1
 
 
+def _contains_any(lower: str, markers: Tuple[str, ...]) -> bool:
+    # Plain loop rather than any(<genexpr>): this runs several times per log
+    # line and the generator frame dominates the cost of the substring tests.
+    for marker in markers:
+        if marker in lower:
+            return True
+    return False
+
+
 def _increment(value: int) -> int:
     return value + 1 if value < 10_000 else value
 
 
-def parse_quickset_logs(device_log: str) -> QuicksetLogSignals:
+def _iter_log_lines(device_log: Union[str, Iterable[str]]) -> Iterator[str]:
+    # Iterables (e.g. an open logcat file) are streamed item by item instead of
+    # being joined first; each item is still split with str.splitlines(), so
+    # embedded newlines and lone "\r" end a line exactly as for str input.
+    chunks = (device_log,) if isinstance(device_log, str) else device_log
+    for chunk in chunks:
+        for raw_line in chunk.splitlines():
+            line = raw_line.rstrip()
+            if line:
+                yield line
+
+
+def parse_quickset_logs(device_log: Union[str, Iterable[str]]) -> QuicksetLogSignals:
     signals = QuicksetLogSignals()
     state = ParserState.IDLE
     tv_config_active = False
 
-    for raw_line in device_log.splitlines():
-        if not raw_line:
-            continue
-        line = raw_line.rstrip()
+    for line in _iter_log_lines(device_log):
         lower = line.lower()
         if "quickset" in lower or "[uapi]" in lower:
             signals.quickset_seen = True
 
-        timestamp = _parse_timestamp(line)
+        # Timestamps only matter on the rare autosync start/end/error lines.
+        is_start = _contains_any(lower, AUTOSYNC_START_MARKERS)
+        is_success = _contains_any(lower, AUTOSYNC_SUCCESS_MARKERS)
+        is_error = _contains_any(lower, AUTOSYNC_ERROR_MARKERS) or (
+            "exception" in lower and "quickset" in lower
+        )
+        timestamp = _parse_timestamp(line) if (is_start or is_success or is_error) else None
 
-        if any(marker in lower for marker in AUTOSYNC_START_MARKERS):
+        if is_start:
             signals.autosync_started = True
             if not signals.autosync_started_at and timestamp:
                 signals.autosync_started_at = timestamp
             state = ParserState.SYNCING
             _append_marker(signals, "AUTOSYNC_START")
 
-        if any(marker in lower for marker in AUTOSYNC_SUCCESS_MARKERS):
+        if is_success:
             signals.autosync_completed_successfully = True
             signals.autosync_failed = False
             if not signals.autosync_completed_at and timestamp:
@@ -252,9 +287,7 @@ def parse_quickset_logs(device_log: str) -> QuicksetLogSignals:
             state = ParserState.COMPLETED_OK
             _append_marker(signals, "AUTOSYNC_SUCCESS")
 
-        if any(marker in lower for marker in AUTOSYNC_ERROR_MARKERS) or (
-            "exception" in lower and "quickset" in lower
-        ):
+        if is_error:
             signals.autosync_failed = True
             if timestamp and not signals.autosync_completed_at:
                 signals.autosync_completed_at = timestamp
@@ -264,15 +297,15 @@ def parse_quickset_logs(device_log: str) -> QuicksetLogSignals:
             state = ParserState.COMPLETED_ERROR
             _append_marker(signals, f"AUTOSYNC_ERROR:{cleaned}")
 
-        brand = _maybe_extract_brand(line)
+        brand = _maybe_extract_brand(line, lower)
         if brand and not signals.tv_brand_inferred:
             signals.tv_brand_inferred = brand
 
-        volume_source = _extract_volume_source(line)
+        volume_source = _extract_volume_source(line, lower)
         if volume_source:
             _update_volume_sources(signals, volume_source)
 
-        tv_device_value = _maybe_extract_tv_device(line)
+        tv_device_value = _maybe_extract_tv_device(line, lower)
         if tv_device_value is not None:
             cleaned = _clean_line(line)
             _append_tv_config_event(signals, cleaned)
@@ -283,7 +316,7 @@ def parse_quickset_logs(device_log: str) -> QuicksetLogSignals:
                 signals.tv_config_cleared_during_run = True
                 tv_config_active = False
 
-        setup_flag = _maybe_extract_is_tv_setup(line)
+        setup_flag = _maybe_extract_is_tv_setup(line, lower)
         if setup_flag is True:
             signals.tv_config_seen = True
             tv_config_active = True
@@ -291,9 +324,9 @@ def parse_quickset_logs(device_log: str) -> QuicksetLogSignals:
             signals.tv_config_cleared_during_run = True
             tv_config_active = False
 
-        if any(pattern in lower for pattern in TV_OSD_MARKERS):
+        if _contains_any(lower, TV_OSD_MARKERS):
             signals.tv_osd_events = _increment(signals.tv_osd_events)
-        if any(pattern in lower for pattern in STB_OSD_MARKERS):
+        if _contains_any(lower, STB_OSD_MARKERS):
             signals.stb_osd_events = _increment(signals.stb_osd_events)
 
     if signals.volume_source_initial == "UNKNOWN" and signals.volume_source_history:
@@ -307,4 +340,4 @@ def parse_quickset_logs(device_log: str) -> QuicksetLogSignals:
 
 def extract_quickset_log_signals(lines: Iterable[str]) -> QuicksetLogSignals:
     """Backward compatible helper for existing tests that supplied line iterables."""
-    return parse_quickset_logs("\n".join(lines))
+    return parse_quickset_logs(lines)
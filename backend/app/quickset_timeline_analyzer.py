@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, asdict, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Literal
+from typing import Any, Callable, Dict, List, Optional, Tuple, Literal
 from datetime import datetime
 import re
+import sys
 from pathlib import Path
 
 from .analyzers.base import AnalyzerResult, FailureInsight
@@ -54,6 +55,7 @@ CRITICAL_STEPS = {
     "question_pairing_screen_seen",
     "question_tv_brand_ui",
 }
+CRITICAL_STEPS_ORDERED = tuple(sorted(CRITICAL_STEPS))
 
 ROOT_CAUSE_METADATA: Dict[str, Dict[str, Any]] = {
     "tester_saw_no_volume_change": {
@@ -347,8 +349,11 @@ VOLUME_SIGNAL_KEYS = (
     "osd_source",
 )
 
+# dataclass(slots=True) is Python 3.10+; older interpreters get a regular dataclass.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class SnapshotState:
     label: str
     raw: Dict[str, Any] = field(default_factory=dict)
@@ -362,7 +367,7 @@ class SnapshotState:
         return self.raw.get("tv_device_name")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StepRow:
     name: str
     label: str
@@ -372,13 +377,27 @@ class StepRow:
     user_answer: Optional[str] = None
     details: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Interned so comparisons against step-name constants hit the identity fast path.
+        self.name = sys.intern(self.name)
+
+    # Flags derived from ``details``; the analyzer mutates ``details`` while it
+    # annotates rows, so these are read through on every access.
+    @property
+    def brand_mismatch(self) -> bool:
+        return bool(self.details.get("brand_mismatch"))
+
+    @property
+    def issue_confirmed_by_probe(self) -> bool:
+        return bool(self.details.get("issue_confirmed_by_probe"))
+
     def to_dict(self) -> Dict[str, Any]:
         data = asdict(self)
         data["status"] = self.status.value
         return data
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SessionSummary:
     session_id: str
     scenario_name: str
@@ -403,7 +422,7 @@ class SessionSummary:
         return data
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LogEvidence:
     autosync_started: bool = False
     autosync_success: bool = False
@@ -427,7 +446,7 @@ class LogEvidence:
     log_signals: Optional[QuicksetLogSignals] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AutosyncLogVerdictInfo:
     autosync_started: bool
     autosync_success: bool
@@ -697,32 +716,19 @@ def build_timeline_and_summary(
         log_evidence=log_evidence,
     )
 
-    if scenario_enum is ScenarioName.LIVE_BUTTON_MAPPING:
-        live_signals = parse_live_button_logs(
-            log_text,
-            expected_channel_value,
-            session_id=session_id,
-        )
-        summary, analyzer_result = _build_live_button_session_summary(
-            session_id=session_id,
-            scenario_name=scenario_enum.value,
-            raw_events=raw_events,
-            timeline_rows=timeline_rows,
-            user_answers=user_answers,
-            live_signals=live_signals,
-            expected_channel=expected_channel_value,
-            log_excerpt=live_log_excerpt,
-        )
-    else:
-        summary, analyzer_result = _build_session_summary(
-            session_id=session_id,
-            scenario_name=scenario_enum.value,
-            raw_events=raw_events,
-            timeline_rows=timeline_rows,
-            log_brand=log_evidence.log_brand,
-            missing_critical=missing_critical,
-            log_evidence=log_evidence,
-        )
+    summary_builder = _SCENARIO_SUMMARY_BUILDERS[scenario_enum]
+    summary, analyzer_result = summary_builder(
+        session_id=session_id,
+        scenario_name=scenario_enum.value,
+        raw_events=raw_events,
+        timeline_rows=timeline_rows,
+        user_answers=user_answers,
+        missing_critical=missing_critical,
+        log_text=log_text,
+        log_excerpt=live_log_excerpt,
+        log_evidence=log_evidence,
+        expected_channel=expected_channel_value,
+    )
 
     summary_dict = summary.to_dict()
     analysis_result_payload = analyzer_result.model_dump(mode="json")
@@ -1215,8 +1221,11 @@ def _event_status_to_step_status(raw_value: Any) -> Optional[StepStatus]:
     return None
 
 
-def _find_row(rows: List[StepRow], name: str) -> Optional[StepRow]:
-    return next((row for row in rows if row.name == name), None)
+def _index_rows(rows: List[StepRow]) -> Dict[str, StepRow]:
+    indexed: Dict[str, StepRow] = {}
+    for row in rows:
+        indexed.setdefault(row.name, row)
+    return indexed
 
 
 def _friendly_label(name: str) -> str:
@@ -1402,10 +1411,11 @@ def _has_tv_control_evidence(
     for row in (volume_row, osd_row):
         if not row:
             continue
-        detection_state = str(row.details.get("volume_probe_detection_state") or "").strip().lower()
+        details = row.details
+        detection_state = str(details.get("volume_probe_detection_state") or "").strip().lower()
         if detection_state == "tv_control":
             return True
-        source = str(row.details.get("volume_probe_source") or "").strip().upper()
+        source = str(details.get("volume_probe_source") or "").strip().upper()
         if source == "TV":
             return True
     volume_source = str(log_evidence.volume_source or "").strip().upper()
@@ -1523,31 +1533,39 @@ def _apply_volume_probe_to_rows(
     if not volume_probe:
         return
 
+    probe_source = volume_probe.get("source")
+    probe_changed = volume_probe.get("changed")
+    probe_detection_state = volume_probe.get("detection_state")
+    probe_confidence = volume_probe.get("confidence")
+    probe_reason = volume_probe.get("detection_reason")
+
     osd_row = rows_by_name.get("question_tv_osd_seen")
     if osd_row:
-        osd_row.details["volume_probe_raw_answer"] = volume_probe.get("raw_answer")
-        osd_row.details["volume_probe_source"] = volume_probe.get("source")
-        osd_row.details["volume_probe_changed"] = volume_probe.get("changed")
-        osd_row.details["volume_probe_detection_state"] = volume_probe.get("detection_state")
-        if volume_probe.get("confidence") is not None:
-            osd_row.details["volume_probe_confidence"] = volume_probe.get("confidence")
-        if volume_probe.get("detection_reason"):
-            osd_row.details["volume_probe_detection_reason"] = volume_probe.get("detection_reason")
+        osd_details = osd_row.details
+        osd_details["volume_probe_raw_answer"] = volume_probe.get("raw_answer")
+        osd_details["volume_probe_source"] = probe_source
+        osd_details["volume_probe_changed"] = probe_changed
+        osd_details["volume_probe_detection_state"] = probe_detection_state
+        if probe_confidence is not None:
+            osd_details["volume_probe_confidence"] = probe_confidence
+        if probe_reason:
+            osd_details["volume_probe_detection_reason"] = probe_reason
         evidence = volume_probe.get("evidence")
         if evidence:
-            osd_row.details["volume_probe_evidence"] = evidence[:3]
+            osd_details["volume_probe_evidence"] = evidence[:3]
 
     volume_row = rows_by_name.get("question_tv_volume_changed")
     if volume_row:
-        volume_row.details["volume_probe_source"] = volume_probe.get("source")
-        volume_row.details["volume_probe_changed"] = volume_probe.get("changed")
-        volume_row.details["volume_probe_detection_state"] = volume_probe.get("detection_state")
-        if volume_probe.get("confidence") is not None:
-            volume_row.details["volume_probe_confidence"] = volume_probe.get("confidence")
-        if volume_probe.get("detection_reason"):
-            volume_row.details["volume_probe_detection_reason"] = volume_probe.get("detection_reason")
-
-    detection_state = str(volume_probe.get("detection_state") or "unknown").lower()
+        volume_details = volume_row.details
+        volume_details["volume_probe_source"] = probe_source
+        volume_details["volume_probe_changed"] = probe_changed
+        volume_details["volume_probe_detection_state"] = probe_detection_state
+        if probe_confidence is not None:
+            volume_details["volume_probe_confidence"] = probe_confidence
+        if probe_reason:
+            volume_details["volume_probe_detection_reason"] = probe_reason
+
+    detection_state = str(probe_detection_state or "unknown").lower()
     volume_yes, volume_no = _answer_flags(volume_row)
     osd_yes, osd_no = _answer_flags(osd_row)
     volume_unanswered = not (volume_yes or volume_no) if volume_row else True
@@ -1837,7 +1855,7 @@ def _build_analysis_details(
         evidence_block["log_signals"] = log_evidence.log_signals.model_dump(mode="json")
 
     contradiction_detected = any(
-        bool(row and row.details.get("issue_confirmed_by_probe")) for row in (volume_row, osd_row)
+        bool(row and row.issue_confirmed_by_probe) for row in (volume_row, osd_row)
     )
     volume_detection_state = str(volume_row.details.get("volume_probe_detection_state") or "").strip().lower() if volume_row else ""
     if volume_detection_state == "stb_control" or (log_evidence.volume_source or "").upper() == "STB":
@@ -1867,15 +1885,14 @@ def _build_live_button_session_summary(
     log_excerpt: Optional[str] = None,
 ) -> Tuple[SessionSummary, AnalyzerResult]:
     started_at, finished_at = _extract_session_times(raw_events)
-    summary_row = _find_row(timeline_rows, "analysis_summary")
-    expected_row = _find_row(timeline_rows, "question_expected_channel") or _find_row(
-        timeline_rows, "live_expected_channel"
-    )
-    config_row = _find_row(timeline_rows, "configure_live_mapping")
+    rows_by_name = _index_rows(timeline_rows)
+    summary_row = rows_by_name.get("analysis_summary")
+    expected_row = rows_by_name.get("question_expected_channel") or rows_by_name.get("live_expected_channel")
+    config_row = rows_by_name.get("configure_live_mapping")
     phase_rows = {
-        "PHASE1": _find_row(timeline_rows, "phase1_live_press"),
-        "PHASE2": _find_row(timeline_rows, "phase2_kill_and_relaunch"),
-        "PHASE3": _find_row(timeline_rows, "phase3_reboot_persist"),
+        "PHASE1": rows_by_name.get("phase1_live_press"),
+        "PHASE2": rows_by_name.get("phase2_kill_and_relaunch"),
+        "PHASE3": rows_by_name.get("phase3_reboot_persist"),
     }
 
     expected_channel_text = user_answers.get("question_expected_channel")
@@ -1978,7 +1995,7 @@ def _build_live_button_session_summary(
             summary_row.details = details
             summary_row.status = StepStatus.INCONCLUSIVE
 
-        test_completed_row = _find_row(timeline_rows, "test_completed")
+        test_completed_row = rows_by_name.get("test_completed")
         if test_completed_row:
             test_completed_row.status = StepStatus.INCONCLUSIVE
             if finished_at:
@@ -2068,7 +2085,7 @@ def _build_live_button_session_summary(
             )
             summary_row.details = details
             summary_row.status = StepStatus.FAIL
-        test_completed_row = _find_row(timeline_rows, "test_completed")
+        test_completed_row = rows_by_name.get("test_completed")
         if test_completed_row:
             test_completed_row.status = StepStatus.FAIL
             if finished_at:
@@ -2256,7 +2273,7 @@ def _build_live_button_session_summary(
         summary_row.details = details
         summary_row.status = overall
 
-    test_completed_row = _find_row(timeline_rows, "test_completed")
+    test_completed_row = rows_by_name.get("test_completed")
     if test_completed_row:
         test_completed_row.status = overall
         if finished_at:
@@ -2307,12 +2324,13 @@ def _build_session_summary(
 ) -> Tuple[SessionSummary, AnalyzerResult]:
     started_at, finished_at = _extract_session_times(raw_events)
 
-    summary_row = next((r for r in timeline_rows if r.name == "analysis_summary"), None)
-    brand_row = next((r for r in timeline_rows if r.name == "question_tv_brand_ui"), None)
-    volume_row = next((r for r in timeline_rows if r.name == "question_tv_volume_changed"), None)
-    osd_row = next((r for r in timeline_rows if r.name == "question_tv_osd_seen"), None)
-    pairing_row = next((r for r in timeline_rows if r.name == "question_pairing_screen_seen"), None)
-    notes_row = next((r for r in timeline_rows if r.name == "question_notes"), None)
+    rows_by_name = _index_rows(timeline_rows)
+    summary_row = rows_by_name.get("analysis_summary")
+    brand_row = rows_by_name.get("question_tv_brand_ui")
+    volume_row = rows_by_name.get("question_tv_volume_changed")
+    osd_row = rows_by_name.get("question_tv_osd_seen")
+    pairing_row = rows_by_name.get("question_pairing_screen_seen")
+    notes_row = rows_by_name.get("question_notes")
     volume_answer = _normalized_answer(volume_row)
     osd_answer = _normalized_answer(osd_row)
     volume_yes = volume_answer in YES_ANSWERS
@@ -2324,7 +2342,7 @@ def _build_session_summary(
     pairing_no = pairing_answer in NO_ANSWERS
     tv_control_evidence = _has_tv_control_evidence(volume_row, osd_row, log_evidence)
     missing_tv_responses = volume_no and osd_no and not tv_control_evidence
-    volume_probe_step = next((r for r in timeline_rows if r.name == "volume_probe_result"), None)
+    volume_probe_step = rows_by_name.get("volume_probe_result")
     probe_details = volume_probe_step.details if volume_probe_step else {}
     raw_volume_source = probe_details.get("volume_source") or log_evidence.volume_source
     probe_confidence_value = _safe_float(probe_details.get("confidence"))
@@ -2340,19 +2358,17 @@ def _build_session_summary(
     )
     probe_confidence = float(probe_confidence_value or 0.0)
 
-    brand_mismatch_raw = bool(brand_row and brand_row.details.get("brand_mismatch"))
+    brand_mismatch_raw = bool(brand_row and brand_row.brand_mismatch)
 
     tester_brand_issue = _tester_issue_from_row(brand_row)
 
-    awaiting_steps = sorted(
-        set(missing_critical).union(
-            {
-                row.name
-                for row in timeline_rows
-                if row.name in CRITICAL_STEPS and row.status == StepStatus.AWAITING_INPUT
-            }
-        )
-    )
+    awaiting_names = set(missing_critical)
+    for row in timeline_rows:
+        if row.status == StepStatus.AWAITING_INPUT and row.name in CRITICAL_STEPS:
+            awaiting_names.add(row.name)
+    # missing_critical is always a subset of CRITICAL_STEPS, so filtering the
+    # pre-sorted names keeps the historical alphabetical order without a sort.
+    awaiting_steps = [name for name in CRITICAL_STEPS_ORDERED if name in awaiting_names]
     any_await = bool(awaiting_steps)
     final_stage = summary_row is not None
 
@@ -2377,10 +2393,9 @@ def _build_session_summary(
 
     brand_mismatch = bool(analyzer_brand_issue)
 
-    tv_brand_user = brand_row.details.get("tv_brand_user") if brand_row else None
-    tv_brand_log = (
-        brand_row.details.get("tv_brand_log") if brand_row else log_brand
-    )
+    brand_details = brand_row.details if brand_row else {}
+    tv_brand_user = brand_details.get("tv_brand_user")
+    tv_brand_log = brand_details.get("tv_brand_log") if brand_row else log_brand
 
     autosync_logs = _evaluate_autosync_from_logs(log_evidence.log_signals)
     log_evidence.autosync_started = autosync_logs.autosync_started
@@ -2560,7 +2575,7 @@ def _build_session_summary(
         summary_row.details["confidence"] = confidence
         summary_row.details["confidence_level"] = confidence
 
-    test_completed_row = next((r for r in timeline_rows if r.name == "test_completed"), None)
+    test_completed_row = rows_by_name.get("test_completed")
     if test_completed_row:
         test_completed_row.status = overall
         if finished_at:
@@ -2586,3 +2601,66 @@ def _build_session_summary(
     )
 
     return session_summary, analyzer_result
+
+
+# ----------------------- SCENARIO DISPATCH ----------------------- #
+
+SummaryBuilder = Callable[..., Tuple[SessionSummary, AnalyzerResult]]
+
+
+def _summarize_tv_auto_sync(
+    *,
+    session_id: str,
+    scenario_name: str,
+    raw_events: List[Dict[str, Any]],
+    timeline_rows: List[StepRow],
+    missing_critical: set[str],
+    log_evidence: LogEvidence,
+    **_: Any,
+) -> Tuple[SessionSummary, AnalyzerResult]:
+    return _build_session_summary(
+        session_id=session_id,
+        scenario_name=scenario_name,
+        raw_events=raw_events,
+        timeline_rows=timeline_rows,
+        log_brand=log_evidence.log_brand,
+        missing_critical=missing_critical,
+        log_evidence=log_evidence,
+    )
+
+
+def _summarize_live_button_mapping(
+    *,
+    session_id: str,
+    scenario_name: str,
+    raw_events: List[Dict[str, Any]],
+    timeline_rows: List[StepRow],
+    user_answers: Dict[str, str],
+    log_text: str,
+    log_excerpt: Optional[str],
+    expected_channel: int,
+    **_: Any,
+) -> Tuple[SessionSummary, AnalyzerResult]:
+    live_signals = parse_live_button_logs(
+        log_text,
+        expected_channel,
+        session_id=session_id,
+    )
+    return _build_live_button_session_summary(
+        session_id=session_id,
+        scenario_name=scenario_name,
+        raw_events=raw_events,
+        timeline_rows=timeline_rows,
+        user_answers=user_answers,
+        live_signals=live_signals,
+        expected_channel=expected_channel,
+        log_excerpt=log_excerpt,
+    )
+
+
+# One entry per ScenarioName; build_timeline_and_summary dispatches with a
+# single lookup instead of branching on the scenario for every session.
+_SCENARIO_SUMMARY_BUILDERS: Dict[ScenarioName, SummaryBuilder] = {
+    ScenarioName.TV_AUTO_SYNC: _summarize_tv_auto_sync,
+    ScenarioName.LIVE_BUTTON_MAPPING: _summarize_live_button_mapping,
+}
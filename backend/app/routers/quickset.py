@@ -531,6 +531,7 @@ def _execute_tv_auto_sync(session_id: str, tester_id: str, stb_ip: str) -> None:
     raw_dir.mkdir(parents=True, exist_ok=True)
     step_logger = QuickSetStepLogger(session_id=session_id, output_dir=STEP_LOG_DIR)
     quickset_session_store.set_state(session_id, "running")
+    adb_client: Optional[ADBClient] = None
 
     try:
         precheck_result = _run_adb_precheck(session_id, step_logger, stb_ip)
@@ -599,6 +600,8 @@ def _execute_tv_auto_sync(session_id: str, tester_id: str, stb_ip: str) -> None:
             summary=final_summary or None,
         )
     finally:
+        if adb_client is not None:
+            adb_client.close_shell_session()
         step_logger.close()
 
 
@@ -845,6 +848,7 @@ def _execute_live_button_mapping(
             summary=final_summary or None,
         )
     finally:
+        adb_client.close_shell_session()
         step_logger.close()
 
 
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator
+
+from fastapi.testclient import TestClient
+import pytest
+
+from backend.app.main import app
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def api_headers() -> Dict[str, str]:
+    return {"X-QuickSet-Api-Key": "test-key"}
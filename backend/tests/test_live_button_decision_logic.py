@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Dict, List
 
 from backend.app.live_button_log_parser import LiveButtonPhaseSignals, LiveButtonSignals
@@ -10,62 +11,35 @@ from backend.app.quickset_timeline_analyzer import (
 )
 
 
+_QUESTION_ROW = StepRow(
+    name="question_expected_channel",
+    label="Expected channel",
+    status=StepStatus.INFO,
+    user_answer="",
+)
+_METADATA_ROW = StepRow(
+    name="live_expected_channel",
+    label="Expected channel",
+    status=StepStatus.INFO,
+)
+_BASE_ROWS = (
+    StepRow(name="configure_live_mapping", label="Configure Live button mapping", status=StepStatus.INFO),
+    StepRow(name="phase1_live_press", label="Phase1", status=StepStatus.INFO),
+    StepRow(name="phase2_kill_and_relaunch", label="Phase2", status=StepStatus.INFO),
+    StepRow(name="phase3_reboot_persist", label="Phase3", status=StepStatus.INFO),
+    StepRow(name="analysis_summary", label="Scenario summary", status=StepStatus.INFO),
+)
+
+
 def _build_rows(include_question: bool = True, include_metadata: bool = True) -> List[StepRow]:
-    rows: List[StepRow] = []
+    # The analyzer mutates rows in place, so every test gets fresh copies of the templates.
+    templates: List[StepRow] = []
     if include_question:
-        rows.append(
-            StepRow(
-                name="question_expected_channel",
-                label="Expected channel",
-                status=StepStatus.INFO,
-                user_answer="",
-                details={},
-            )
-        )
+        templates.append(_QUESTION_ROW)
     if include_metadata:
-        rows.append(
-            StepRow(
-                name="live_expected_channel",
-                label="Expected channel",
-                status=StepStatus.INFO,
-                details={},
-            )
-        )
-    rows.extend(
-        [
-            StepRow(
-                name="configure_live_mapping",
-                label="Configure Live button mapping",
-                status=StepStatus.INFO,
-                details={},
-            ),
-            StepRow(
-                name="phase1_live_press",
-                label="Phase1",
-                status=StepStatus.INFO,
-                details={},
-            ),
-            StepRow(
-                name="phase2_kill_and_relaunch",
-                label="Phase2",
-                status=StepStatus.INFO,
-                details={},
-            ),
-            StepRow(
-                name="phase3_reboot_persist",
-                label="Phase3",
-                status=StepStatus.INFO,
-                details={},
-            ),
-            StepRow(
-                name="analysis_summary",
-                label="Scenario summary",
-                status=StepStatus.INFO,
-                details={},
-            ),
-        ]
-    )
-    return rows
+        templates.append(_METADATA_ROW)
+    templates.extend(_BASE_ROWS)
+    return [replace(row, details={}) for row in templates]
 
 
 def _build_user_answers(expected: str) -> Dict[str, str]:
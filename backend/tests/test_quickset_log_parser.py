@@ -1,4 +1,4 @@
-from backend.app.quickset_log_parser import parse_quickset_logs
+from backend.app.quickset_log_parser import extract_quickset_log_signals, parse_quickset_logs
 
 GOOD_QUICKSET_LOG = """
 12-08 10:02:43.628 D/QSDPRINT(13313): Entry QSP_get_device_brand, device ID: 0
@@ -73,3 +73,20 @@ def test_parse_quickset_logs_detects_config_clear_and_failures() -> None:
     assert signals.stb_volume_events >= 1
     assert signals.volume_source_final == "STB"
     assert signals.autosync_error_codes
+
+
+def test_parse_quickset_logs_keeps_millisecond_precision_within_same_second() -> None:
+    signals = parse_quickset_logs(GOOD_QUICKSET_LOG)
+
+    assert signals.autosync_started_at is not None
+    assert signals.autosync_started_at.strftime("%m-%d %H:%M:%S.%f") == "12-08 10:02:43.676000"
+    assert signals.autosync_completed_at is not None
+    assert signals.autosync_completed_at.strftime("%m-%d %H:%M:%S.%f") == "12-08 10:02:45.983000"
+
+
+def test_parse_quickset_logs_splits_multiline_iterable_items() -> None:
+    lines = GOOD_QUICKSET_LOG.strip().splitlines()
+    chunks = ["\r".join(lines[:4]), "\n".join(lines[4:]) + "\n"]
+
+    assert extract_quickset_log_signals(chunks) == parse_quickset_logs(GOOD_QUICKSET_LOG)
+    assert parse_quickset_logs("\r\n".join(lines)) == parse_quickset_logs(GOOD_QUICKSET_LOG)
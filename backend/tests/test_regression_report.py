@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-import importlib.util
+import io
+import json
 from pathlib import Path
 from typing import Any, Dict, List
 
-MODULE_PATH = Path(__file__).resolve().parents[1] / "tools" / "regression_report.py"
-spec = importlib.util.spec_from_file_location("regression_report_module", MODULE_PATH)
-regression_report = importlib.util.module_from_spec(spec)
-assert spec.loader is not None
-spec.loader.exec_module(regression_report)  # type: ignore[attr-defined]
+import pytest
+
+from backend.tools import regression_report
 
 
 def _question_step(name: str, answer: str = "yes", status: str = "PASS") -> Dict[str, Any]:
@@ -124,3 +123,73 @@ def test_regression_report_tv_autosync_inconclusive_pass_highlights_logs() -> No
     assert "Conflicts:" in rendered
     assert "Logs/telemetry inconclusive; relying on tester answers." in rendered
     assert "Evidence highlights:" in rendered
+
+
+@pytest.mark.parametrize("evidence", [["tv_volume_events"], "tv_volume_events"])
+def test_regression_report_tolerates_non_mapping_evidence(evidence: Any) -> None:
+    data = {
+        "session": {"session_id": "QS_OLD", "scenario_name": "TV_AUTO_SYNC"},
+        "timeline": [_analysis_summary({"tester_verdict": "PASS", "evidence": evidence})],
+    }
+
+    lines = _build_lines(data)
+
+    assert "  Evidence highlights:" in lines
+    assert not any(line.startswith("    - tv_volume_events") for line in lines)
+
+
+def test_regression_report_streaming_load_matches_full_load(tmp_path: Path) -> None:
+    pytest.importorskip("ijson")
+    data = {
+        "session_id": "QS_STREAM",
+        "session": {"session_id": "QS_STREAM", "scenario_name": "TV_AUTO_SYNC", "overall_status": "FAIL"},
+        "timeline": [
+            {"name": f"probe_{idx}", "status": "PASS", "details": {"samples": [idx, idx + 0.5]}}
+            for idx in range(50)
+        ]
+        + [
+            _question_step("question_tv_volume_changed", answer="no", status="FAIL"),
+            _question_step("question_tv_osd_seen"),
+            _analysis_summary({"tester_verdict": "FAIL", "failed_steps": ["question_tv_volume_changed"]}),
+        ],
+        "has_failure": True,
+    }
+    path = tmp_path / "session_QS_STREAM.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    snapshot = regression_report.load_snapshot_streaming(path)
+
+    assert [row["name"] for row in snapshot["timeline"]] == [
+        "question_tv_volume_changed",
+        "question_tv_osd_seen",
+        "analysis_summary",
+    ]
+    assert regression_report.build_report_lines_streaming(path) == regression_report.build_report_lines(
+        data, source_path=path
+    )
+
+
+def test_regression_report_loads_zstd_compressed_snapshot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    data = {"session": {"session_id": "QS_ZST", "overall_status": "PASS"}, "timeline": []}
+    compressed = tmp_path / "session_QS_ZST.json.zst"
+    compressed.write_bytes(zstandard.ZstdCompressor(level=3).compress(json.dumps(data).encode("utf-8")))
+    (tmp_path / "session_QS_ZST.json").write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(regression_report, "REGRESSION_DIR", tmp_path)
+
+    path = regression_report.snapshot_path("QS_ZST")
+
+    assert path == compressed
+    assert regression_report.load_snapshot(path) == data
+
+
+def test_regression_report_write_report_matches_rendered_lines() -> None:
+    data = {
+        "session": {"session_id": "QS_WRITE", "scenario_name": "TV_AUTO_SYNC", "overall_status": "FAIL"},
+        "timeline": [_question_step("question_tv_osd_seen", answer="no", status="FAIL")],
+    }
+    out = io.StringIO()
+
+    regression_report.write_report(data, out, source_path=Path("/tmp/session.json"))
+
+    assert out.getvalue() == "\n".join(_build_lines(data)) + "\n"
@@ -1,39 +1,37 @@
 from __future__ import annotations
 
-from fastapi.testclient import TestClient
 import pytest
 
-from backend.app.main import app
 from backend.app.routers import quickset as quickset_router
 from backend.app.scenario_enums import ScenarioName
 from backend.app.quickset_timeline_analyzer import build_timeline_and_summary
 from backend.app.device_control import _parse_focus_from_window, _parse_focus_from_activity
 
 
-client = TestClient(app)
-API_HEADERS = {"X-QuickSet-Api-Key": "test-key"}
-
-
-@pytest.fixture(autouse=True)
-def stub_workflow_thread(monkeypatch):
+@pytest.fixture(autouse=True, scope="module")
+def stub_workflow_thread():
     def _noop(handler, session_id, *args, **kwargs):
         return None
 
-    monkeypatch.setattr(quickset_router, "_launch_workflow_thread", _noop)
+    # Module-scoped so the stub never leaks into other test modules; the
+    # function-scoped ``monkeypatch`` fixture cannot back it.
+    patcher = pytest.MonkeyPatch()
+    patcher.setattr(quickset_router, "_launch_workflow_thread", _noop)
     yield
+    patcher.undo()
 
 
-def test_run_scenario_rejects_invalid_name():
+def test_run_scenario_rejects_invalid_name(client, api_headers):
     response = client.post(
         "/api/quickset/scenarios/run",
         json={"tester_id": "t1", "stb_ip": "127.0.0.1", "scenario_name": "INVALID"},
-        headers=API_HEADERS,
+        headers=api_headers,
     )
     assert response.status_code == 400
     assert response.json()["detail"] == "Unsupported scenario"
 
 
-def test_run_scenario_rejects_expected_channel_for_tv_auto_sync():
+def test_run_scenario_rejects_expected_channel_for_tv_auto_sync(client, api_headers):
     response = client.post(
         "/api/quickset/scenarios/run",
         json={
@@ -42,13 +40,13 @@ def test_run_scenario_rejects_expected_channel_for_tv_auto_sync():
             "scenario_name": "TV_AUTO_SYNC",
             "expected_channel": 5,
         },
-        headers=API_HEADERS,
+        headers=api_headers,
     )
     assert response.status_code == 400
     assert "expected_channel" in response.json()["detail"]
 
 
-def test_run_scenario_accepts_live_with_expected_channel():
+def test_run_scenario_accepts_live_with_expected_channel(client, api_headers):
     response = client.post(
         "/api/quickset/scenarios/run",
         json={
@@ -57,7 +55,7 @@ def test_run_scenario_accepts_live_with_expected_channel():
             "scenario_name": "LIVE_BUTTON_MAPPING",
             "expected_channel": 11,
         },
-        headers=API_HEADERS,
+        headers=api_headers,
     )
     assert response.status_code == 201
     data = response.json()
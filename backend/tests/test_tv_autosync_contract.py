@@ -10,17 +10,31 @@ Scenarios covered (see tv_autosync_contract.yml):
 - no_volume_change_issue
 - brand_mismatch_only
 - volume_mismatch_only
+
+The scenarios share no state, so they can be spread over xdist workers:
+    pytest -n 4 backend/tests/test_tv_autosync_contract.py
+Each worker parses the (small) contract once through the cached loader.
 """
 
 from __future__ import annotations
 
-import json
+import functools
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 import pytest
 import yaml
 
+try:  # orjson parses JSONL considerably faster when installed
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    from json import loads as _json_loads
+
+try:  # libyaml C bindings when available
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as YamlSafeLoader
+
 # ==== PATHS – adjust if your repo layout is different ======================
 
 # root of the backend repo (…/TestProj/backend/)
@@ -49,14 +63,8 @@ def load_jsonl(path: Path) -> List[Dict[str, Any]]:
     """Load a JSONL file (one JSON object per line). Returns empty list if file is missing."""
     if not path.exists():
         return []
-    lines: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            lines.append(json.loads(line))
-    return lines
+    data = path.read_bytes()
+    return [_json_loads(line) for line in data.splitlines() if line.strip()]
 
 
 def load_session_artifacts(session_id: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
@@ -80,22 +88,20 @@ def load_contract() -> Dict[str, Any]:
         raise AssertionError(
             f"[TV_AUTO_SYNC contract] Contract file not found at {CONTRACT_PATH}"
         )
-    with CONTRACT_PATH.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    return _load_contract_cached(CONTRACT_PATH, CONTRACT_PATH.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_contract_cached(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    with path.open("r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=YamlSafeLoader)
     if not isinstance(data, dict) or "scenarios" not in data:
         raise AssertionError(
-            f"[TV_AUTO_SYNC contract] Malformed YAML: expected 'scenarios' key in {CONTRACT_PATH}"
+            f"[TV_AUTO_SYNC contract] Malformed YAML: expected 'scenarios' key in {path}"
         )
     return data["scenarios"]
 
 
-def find_timeline_row(timeline: List[Dict[str, Any]], name: str) -> Dict[str, Any]:
-    for row in timeline:
-        if row.get("name") == name:
-            return row
-    raise AssertionError(f"[TV_AUTO_SYNC contract] Timeline row '{name}' not found")
-
-
 # ==== fixtures =============================================================
 
 
@@ -105,6 +111,23 @@ def contract() -> Dict[str, Any]:
     return load_contract()
 
 
+@pytest.fixture(scope="session")
+def all_artifacts(contract: Dict[str, Any]) -> Dict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """Events + answers for every contract session, read once per test session.
+
+    Sessions whose artifacts are missing are left out so the parametrized test
+    reports them individually via load_session_artifacts.
+    """
+    artifacts: Dict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
+    for cfg in contract.values():
+        session_id = cfg["session_id"]
+        try:
+            artifacts[session_id] = load_session_artifacts(session_id)
+        except AssertionError:
+            continue
+    return artifacts
+
+
 @pytest.fixture(scope="session")
 def backend_root() -> Path:
     return BACKEND_ROOT
@@ -122,7 +145,11 @@ def backend_root() -> Path:
         "volume_mismatch_only",
     ],
 )
-def test_tv_autosync_contract(scenario_key: str, contract: Dict[str, Any]) -> None:
+def test_tv_autosync_contract(
+    scenario_key: str,
+    contract: Dict[str, Any],
+    all_artifacts: Dict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]],
+) -> None:
     """
     Single contract test that runs the analyzer on a real session for each scenario
     and asserts both summary fields and key timeline statuses.
@@ -135,7 +162,8 @@ def test_tv_autosync_contract(scenario_key: str, contract: Dict[str, Any]) -> No
     expected_steps = scenario_cfg["expected_steps"]
 
     # 1. load events + answers from artifacts
-    raw_events, _ = load_session_artifacts(session_id)
+    artifacts = all_artifacts.get(session_id)
+    raw_events, _ = artifacts if artifacts is not None else load_session_artifacts(session_id)
 
     # 2. run analyzer exactly like the router does
     payload = build_timeline_and_summary(
@@ -146,22 +174,18 @@ def test_tv_autosync_contract(scenario_key: str, contract: Dict[str, Any]) -> No
     session_summary = payload["session"]
     timeline = payload["timeline"]
 
-    # 3. assert summary contract
-    assert session_summary["scenario_name"] == expected_summary["scenario_name"]
-    assert session_summary["overall_status"] == expected_summary["overall_status"]
-    assert session_summary["analysis_text"] == expected_summary["analysis_text"]
-
-    assert session_summary["brand_mismatch"] == expected_summary["brand_mismatch"]
-    assert session_summary["tv_brand_user"] == expected_summary["tv_brand_user"]
-    assert session_summary["tv_brand_log"] == expected_summary["tv_brand_log"]
-
-    assert session_summary["has_volume_issue"] == expected_summary["has_volume_issue"]
-    assert session_summary["has_osd_issue"] == expected_summary["has_osd_issue"]
-    assert session_summary["has_failure"] == expected_summary["has_failure"]
+    # 3. assert summary contract (one dict compare so pytest diffs every mismatch at once)
+    actual_summary = {key: session_summary.get(key) for key in expected_summary}
+    assert actual_summary == expected_summary, f"[{scenario_key}] session summary does not match contract"
 
     # 4. assert key step statuses
+    # First row per name wins, as in the analyzer's _index_rows.
+    rows_by_name: Dict[str, Dict[str, Any]] = {}
+    for row in timeline:
+        rows_by_name.setdefault(row.get("name"), row)
     for step_name, expected_status in expected_steps.items():
-        row = find_timeline_row(timeline, step_name)
+        row = rows_by_name.get(step_name)
+        assert row is not None, f"[TV_AUTO_SYNC contract] Timeline row '{step_name}' not found"
         actual_status = row.get("status")
         assert (
             actual_status == expected_status
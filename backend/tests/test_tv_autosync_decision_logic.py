@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import List, Set
+from dataclasses import replace
+from typing import Any, Dict, List, Set
 
 from backend.app.quickset_log_parser import QuicksetLogSignals
-from backend.quickset_timeline_analyzer import (
+from backend.app.quickset_timeline_analyzer import (
     StepRow,
     StepStatus,
     LogEvidence,
@@ -11,24 +12,86 @@ from backend.quickset_timeline_analyzer import (
     _merge_quickset_signals,
 )
 
+# All-pass skeleton shared by the tests; each test overrides only the rows it
+# cares about. The analyzer mutates rows, so _rows() always hands out copies.
+_VOLUME_PASS = StepRow(
+    name="question_tv_volume_changed",
+    label="TV volume changed",
+    status=StepStatus.PASS,
+    user_answer="yes",
+)
+_OSD_PASS = StepRow(
+    name="question_tv_osd_seen",
+    label="TV OSD seen",
+    status=StepStatus.PASS,
+    user_answer="yes",
+)
+_PAIRING_PASS = StepRow(
+    name="question_pairing_screen_seen",
+    label="Pairing screen",
+    status=StepStatus.PASS,
+    user_answer="yes",
+)
+_BRAND_PASS_LG = StepRow(
+    name="question_tv_brand_ui",
+    label="TV brand (UI vs log)",
+    status=StepStatus.PASS,
+    user_answer="LG",
+    details={"tv_brand_user": "LG", "tv_brand_log": "LG"},
+)
+_PROBE_RESULT = StepRow(
+    name="volume_probe_result",
+    label="Volume probe result",
+    status=StepStatus.INFO,
+)
+BASE_ROWS: Dict[str, StepRow] = {
+    "volume": _VOLUME_PASS,
+    "osd": _OSD_PASS,
+    "pairing": _PAIRING_PASS,
+    "brand": _BRAND_PASS_LG,
+}
+
+
+def _row(base: StepRow, **overrides: Any) -> StepRow:
+    details = overrides.pop("details", base.details)
+    return replace(base, details=dict(details), **overrides)
+
+
+def _rows(*extra: StepRow, **overrides: StepRow) -> List[StepRow]:
+    rows = [_row(overrides.get(key, base)) for key, base in BASE_ROWS.items()]
+    rows.extend(_row(row) for row in extra)
+    return rows
+
+
+def _brand(answer: str, log: str | None, **details: Any) -> StepRow:
+    return _row(
+        _BRAND_PASS_LG,
+        user_answer=answer,
+        details={"tv_brand_user": answer, "tv_brand_log": log, **details},
+    )
+
 
 def _build_rows(rows: List[StepRow]) -> List[StepRow]:
-    # helper to ensure we always include analysis summary at the end
-    names = {row.name for row in rows}
-    if "analysis_summary" not in names:
-        rows.append(
-            StepRow(
-                name="analysis_summary",
-                label="Scenario summary",
-                status=StepStatus.INFO,
-                details={},
-            )
+    # callers never pass analysis_summary; it always goes last
+    rows.append(
+        StepRow(
+            name="analysis_summary",
+            label="Scenario summary",
+            status=StepStatus.INFO,
+            details={},
         )
+    )
     return rows
 
 
-def _run_summary(rows: List[StepRow], log_evidence: LogEvidence, log_brand: str | None = None) -> tuple:
-    timeline = _build_rows(rows)
+def _run_summary(
+    log_evidence: LogEvidence,
+    *extra: StepRow,
+    log_brand: str | None = None,
+    **overrides: StepRow,
+) -> tuple:
+    # rows are given as a delta from BASE_ROWS (see _rows)
+    timeline = _build_rows(_rows(*extra, **overrides))
     missing: Set[str] = set()
     summary, analyzer_result = _build_session_summary(
         session_id="QS_TEST",
@@ -43,41 +106,14 @@ def _run_summary(rows: List[StepRow], log_evidence: LogEvidence, log_brand: str
 
 
 def test_tv_auto_sync_brand_mismatch_is_fail() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.PASS,
-            user_answer="yes",
-            details={"volume_probe_detection_state": "tv_control"},
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.FAIL,
-            user_answer="dhshkdhs",
-            details={
-                "tv_brand_user": "dhshkdhs",
-                "tv_brand_log": "LG",
-                "brand_mismatch": True,
-            },
-        ),
-    ]
     log_evidence = LogEvidence(autosync_started=True, autosync_success=True, osd_tv=True, volume_source="TV")
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand="LG")
+    summary, analyzer_result = _run_summary(
+        log_evidence,
+        volume=_row(_VOLUME_PASS, details={"volume_probe_detection_state": "tv_control"}),
+        brand=_row(_brand("dhshkdhs", "LG", brand_mismatch=True), status=StepStatus.FAIL),
+        log_brand="LG",
+    )
 
     assert summary.overall_status == StepStatus.FAIL
     assert summary.has_failure is True
@@ -90,50 +126,6 @@ def test_tv_auto_sync_brand_mismatch_is_fail() -> None:
 
 
 def test_tv_auto_sync_probe_unknown_but_tester_pass_is_pass() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.PASS,
-            user_answer="yes",
-            details={
-                "volume_probe_detection_state": "unknown",
-                "volume_probe_confidence": 0.2,
-            },
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.PASS,
-            user_answer="Lg",
-            details={
-                "tv_brand_user": "Lg",
-                "tv_brand_log": None,
-                "brand_mismatch": False,
-            },
-        ),
-        StepRow(
-            name="volume_probe_result",
-            label="Volume probe result",
-            status=StepStatus.INFO,
-            details={
-                "volume_source": "TV",
-                "confidence": 0.8,
-            },
-        ),
-    ]
     log_evidence = LogEvidence(
         autosync_started=True,
         autosync_success=True,
@@ -143,7 +135,16 @@ def test_tv_auto_sync_probe_unknown_but_tester_pass_is_pass() -> None:
         tv_config_seen=True,
     )
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand=None)
+    summary, analyzer_result = _run_summary(
+        log_evidence,
+        _row(_PROBE_RESULT, details={"volume_source": "TV", "confidence": 0.8}),
+        volume=_row(
+            _VOLUME_PASS,
+            details={"volume_probe_detection_state": "unknown", "volume_probe_confidence": 0.2},
+        ),
+        brand=_brand("Lg", None, brand_mismatch=False),
+        log_brand=None,
+    )
 
     assert summary.overall_status == StepStatus.PASS
     assert summary.has_failure is False
@@ -161,42 +162,6 @@ def test_tv_auto_sync_probe_unknown_but_tester_pass_is_pass() -> None:
 
 
 def test_tv_auto_sync_autosync_failed_but_telemetry_unknown_is_tooling() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.PASS,
-            user_answer="LG",
-            details={"tv_brand_user": "LG", "tv_brand_log": "LG"},
-        ),
-        StepRow(
-            name="volume_probe_result",
-            label="Volume probe result",
-            status=StepStatus.INFO,
-            details={
-                "volume_source": "UNKNOWN",
-                "confidence": 0.0,
-            },
-        ),
-    ]
     log_evidence = LogEvidence(
         autosync_started=True,
         autosync_success=False,
@@ -206,7 +171,11 @@ def test_tv_auto_sync_autosync_failed_but_telemetry_unknown_is_tooling() -> None
         tv_config_seen=True,
     )
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand="LG")
+    summary, analyzer_result = _run_summary(
+        log_evidence,
+        _row(_PROBE_RESULT, details={"volume_source": "UNKNOWN", "confidence": 0.0}),
+        log_brand="LG",
+    )
 
     assert summary.overall_status == StepStatus.FAIL
     assert summary.analysis_text.startswith("Auto-sync did not complete successfully in logs.")
@@ -222,46 +191,6 @@ def test_tv_auto_sync_autosync_failed_but_telemetry_unknown_is_tooling() -> None
 
 
 def test_tv_auto_sync_probe_stb_control_confident_is_fail() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.PASS,
-            user_answer="yes",
-            details={
-                "volume_probe_detection_state": "stb_control",
-                "volume_probe_confidence": 0.9,
-            },
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.PASS,
-            user_answer="LG",
-            details={"tv_brand_user": "LG", "tv_brand_log": "LG"},
-        ),
-        StepRow(
-            name="volume_probe_result",
-            label="Volume probe result",
-            status=StepStatus.INFO,
-            details={
-                "volume_source": "STB",
-                "confidence": 0.9,
-            },
-        ),
-    ]
     log_evidence = LogEvidence(
         autosync_started=True,
         autosync_success=True,
@@ -273,7 +202,15 @@ def test_tv_auto_sync_probe_stb_control_confident_is_fail() -> None:
         tv_config_seen=False,
     )
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand="LG")
+    summary, analyzer_result = _run_summary(
+        log_evidence,
+        _row(_PROBE_RESULT, details={"volume_source": "STB", "confidence": 0.9}),
+        volume=_row(
+            _VOLUME_PASS,
+            details={"volume_probe_detection_state": "stb_control", "volume_probe_confidence": 0.9},
+        ),
+        log_brand="LG",
+    )
 
     assert summary.overall_status == StepStatus.FAIL
     assert summary.has_failure is True
@@ -284,37 +221,11 @@ def test_tv_auto_sync_probe_stb_control_confident_is_fail() -> None:
     assert "telemetry indicates STB" in summary.analysis_text
     stb_insight = next(ins for ins in analyzer_result.failure_insights if ins.code == "probe_detected_stb_control")
     assert stb_insight.category == "functional"
-    assert all(ins.code != "volume_probe_inconclusive" for ins in analyzer_result.failure_insights)
+    codes = frozenset(ins.code for ins in analyzer_result.failure_insights)
+    assert "volume_probe_inconclusive" not in codes
 
 
 def test_tv_auto_sync_good_log_sets_ok_status() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.PASS,
-            user_answer="Samsung",
-            details={"tv_brand_user": "Samsung", "tv_brand_log": "Samsung"},
-        ),
-    ]
     log_evidence = LogEvidence(
         autosync_started=True,
         autosync_success=True,
@@ -324,44 +235,18 @@ def test_tv_auto_sync_good_log_sets_ok_status() -> None:
         tv_config_seen=True,
     )
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand="Samsung")
+    summary, analyzer_result = _run_summary(log_evidence, brand=_brand("Samsung", "Samsung"), log_brand="Samsung")
 
     assert summary.overall_status == StepStatus.PASS
     assert summary.volume_status == "OK"
     assert summary.osd_status == "OK"
     assert summary.has_volume_issue is False
     assert summary.has_osd_issue is False
-    assert all(ins.code != "probe_detected_stb_control" for ins in analyzer_result.failure_insights)
+    codes = frozenset(ins.code for ins in analyzer_result.failure_insights)
+    assert "probe_detected_stb_control" not in codes
 
 
 def test_tv_auto_sync_tv_config_cleared_sets_incompatibility_and_insight() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.PASS,
-            user_answer="Philips",
-            details={"tv_brand_user": "Philips", "tv_brand_log": "Philips"},
-        ),
-    ]
     log_evidence = LogEvidence(
         autosync_started=True,
         autosync_success=False,
@@ -373,45 +258,18 @@ def test_tv_auto_sync_tv_config_cleared_sets_incompatibility_and_insight() -> No
         stb_volume_events=True,
     )
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand="Philips")
+    summary, analyzer_result = _run_summary(log_evidence, brand=_brand("Philips", "Philips"), log_brand="Philips")
 
     assert summary.overall_status == StepStatus.FAIL
     assert summary.volume_status == "INCOMPATIBILITY"
     assert summary.osd_status == "INCOMPATIBILITY"
     assert summary.has_volume_issue is True
     assert summary.has_osd_issue is True
-    insight_codes = {ins.code for ins in analyzer_result.failure_insights}
-    assert "tv_config_cleared_during_run" in insight_codes
+    codes = frozenset(ins.code for ins in analyzer_result.failure_insights)
+    assert "tv_config_cleared_during_run" in codes
 
 
 def test_tv_auto_sync_mixed_signals_result_in_unknown() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.PASS,
-            user_answer="LG",
-            details={"tv_brand_user": "LG", "tv_brand_log": "LG"},
-        ),
-    ]
     log_evidence = LogEvidence(
         autosync_started=True,
         autosync_success=True,
@@ -422,7 +280,7 @@ def test_tv_auto_sync_mixed_signals_result_in_unknown() -> None:
         stb_volume_events=True,
     )
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand="LG")
+    summary, analyzer_result = _run_summary(log_evidence, log_brand="LG")
 
     assert summary.overall_status == StepStatus.PASS
     assert summary.volume_status == "UNKNOWN"
@@ -434,46 +292,6 @@ def test_tv_auto_sync_mixed_signals_result_in_unknown() -> None:
 
 
 def test_tv_auto_sync_autosync_started_inferred_from_probe_signals() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.PASS,
-            user_answer="yes",
-            details={
-                "volume_probe_detection_state": "stb_control",
-                "volume_probe_confidence": 0.95,
-            },
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.PASS,
-            user_answer="Samsung",
-            details={"tv_brand_user": "Samsung", "tv_brand_log": "Samsung"},
-        ),
-        StepRow(
-            name="volume_probe_result",
-            label="Volume probe result",
-            status=StepStatus.INFO,
-            details={
-                "volume_source": "STB",
-                "confidence": 0.9,
-            },
-        ),
-    ]
     log_evidence = LogEvidence(
         autosync_started=False,
         autosync_success=False,
@@ -482,43 +300,25 @@ def test_tv_auto_sync_autosync_started_inferred_from_probe_signals() -> None:
         volume_source=None,
     )
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand="Samsung")
+    summary, analyzer_result = _run_summary(
+        log_evidence,
+        _row(_PROBE_RESULT, details={"volume_source": "STB", "confidence": 0.9}),
+        volume=_row(
+            _VOLUME_PASS,
+            details={"volume_probe_detection_state": "stb_control", "volume_probe_confidence": 0.95},
+        ),
+        brand=_brand("Samsung", "Samsung"),
+        log_brand="Samsung",
+    )
 
     assert summary.overall_status == StepStatus.FAIL
     assert "Auto-sync was not triggered" not in summary.analysis_text
-    assert any(ins.code == "probe_detected_stb_control" for ins in analyzer_result.failure_insights)
-    assert all(ins.code != "autosync_not_started" for ins in analyzer_result.failure_insights)
+    codes = frozenset(ins.code for ins in analyzer_result.failure_insights)
+    assert "probe_detected_stb_control" in codes
+    assert "autosync_not_started" not in codes
 
 
 def test_tv_auto_sync_started_but_not_completed_emits_not_completed_insight() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.PASS,
-            user_answer="yes",
-            details={"volume_probe_detection_state": "unknown"},
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.PASS,
-            user_answer="LG",
-            details={"tv_brand_user": "LG", "tv_brand_log": "LG"},
-        ),
-    ]
     log_evidence = LogEvidence(
         autosync_started=True,
         autosync_success=False,
@@ -527,49 +327,20 @@ def test_tv_auto_sync_started_but_not_completed_emits_not_completed_insight() ->
         volume_source=None,
     )
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand="LG")
+    summary, analyzer_result = _run_summary(
+        log_evidence,
+        volume=_row(_VOLUME_PASS, details={"volume_probe_detection_state": "unknown"}),
+        log_brand="LG",
+    )
 
     assert summary.overall_status == StepStatus.FAIL
     assert "did not complete" in summary.analysis_text
-    assert any(ins.code == "autosync_not_completed" for ins in analyzer_result.failure_insights)
-    assert all(ins.code != "autosync_not_started" for ins in analyzer_result.failure_insights)
+    codes = frozenset(ins.code for ins in analyzer_result.failure_insights)
+    assert "autosync_not_completed" in codes
+    assert "autosync_not_started" not in codes
 
 
 def test_tv_auto_sync_reports_not_started_when_no_signals() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.PASS,
-            user_answer="yes",
-            details={},
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-            details={},
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-            details={},
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.PASS,
-            user_answer="LG",
-            details={
-                "tv_brand_user": "LG",
-                "tv_brand_log": None,
-                "brand_mismatch": False,
-            },
-        ),
-    ]
     log_evidence = LogEvidence(
         autosync_started=False,
         autosync_success=False,
@@ -578,41 +349,19 @@ def test_tv_auto_sync_reports_not_started_when_no_signals() -> None:
         volume_source=None,
     )
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand=None)
+    summary, analyzer_result = _run_summary(
+        log_evidence,
+        brand=_brand("LG", None, brand_mismatch=False),
+        log_brand=None,
+    )
 
     assert summary.overall_status == StepStatus.FAIL
     assert "Auto-sync was not triggered in logs." in summary.analysis_text
-    assert any(ins.code == "autosync_not_started" for ins in analyzer_result.failure_insights)
+    codes = frozenset(ins.code for ins in analyzer_result.failure_insights)
+    assert "autosync_not_started" in codes
 
 
 def test_tv_auto_sync_tester_no_volume_forces_fail() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.FAIL,
-            user_answer="no",
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.PASS,
-            user_answer="LG",
-            details={"tv_brand_user": "LG", "tv_brand_log": "LG"},
-        ),
-    ]
     log_evidence = LogEvidence(
         autosync_started=True,
         autosync_success=False,
@@ -621,49 +370,22 @@ def test_tv_auto_sync_tester_no_volume_forces_fail() -> None:
         volume_source=None,
     )
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand="LG")
+    summary, analyzer_result = _run_summary(
+        log_evidence,
+        volume=_row(_VOLUME_PASS, status=StepStatus.FAIL, user_answer="no"),
+        log_brand="LG",
+    )
 
     assert summary.overall_status == StepStatus.FAIL
     assert summary.has_failure is True
     assert summary.volume_status == "FAIL"
     assert summary.has_volume_issue is True
     assert summary.analysis_text.startswith("TV auto-sync failed: tester did not observe TV volume change.")
-    assert any(ins.code == "tester_saw_no_volume_change" for ins in analyzer_result.failure_insights)
+    codes = frozenset(ins.code for ins in analyzer_result.failure_insights)
+    assert "tester_saw_no_volume_change" in codes
 
 
 def test_analysis_details_include_log_signals_payload() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.PASS,
-            user_answer="yes",
-            details={"volume_probe_detection_state": "tv_control"},
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.PASS,
-            user_answer="LG",
-            details={
-                "tv_brand_user": "LG",
-                "tv_brand_log": "LG",
-                "brand_mismatch": False,
-            },
-        ),
-    ]
     log_evidence = LogEvidence()
     signals = QuicksetLogSignals(
         autosync_started=True,
@@ -676,7 +398,12 @@ def test_analysis_details_include_log_signals_payload() -> None:
     )
     _merge_quickset_signals(log_evidence, signals)
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand="LG")
+    summary, analyzer_result = _run_summary(
+        log_evidence,
+        volume=_row(_VOLUME_PASS, details={"volume_probe_detection_state": "tv_control"}),
+        brand=_brand("LG", "LG", brand_mismatch=False),
+        log_brand="LG",
+    )
 
     assert summary.overall_status == StepStatus.PASS
     assert "log_signals" in analyzer_result.evidence
@@ -686,42 +413,15 @@ def test_analysis_details_include_log_signals_payload() -> None:
 
 
 def test_logs_inconclusive_rely_on_tester_pass_without_failures() -> None:
-    rows = [
-        StepRow(
-            name="question_tv_volume_changed",
-            label="TV volume changed",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_osd_seen",
-            label="TV OSD seen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_pairing_screen_seen",
-            label="Pairing screen",
-            status=StepStatus.PASS,
-            user_answer="yes",
-        ),
-        StepRow(
-            name="question_tv_brand_ui",
-            label="TV brand (UI vs log)",
-            status=StepStatus.PASS,
-            user_answer="Samsung",
-            details={
-                "tv_brand_user": "Samsung",
-                "tv_brand_log": "Samsung",
-                "brand_mismatch": False,
-            },
-        ),
-    ]
     log_evidence = LogEvidence()
     signals = QuicksetLogSignals()
     _merge_quickset_signals(log_evidence, signals)
 
-    summary, analyzer_result = _run_summary(rows, log_evidence, log_brand="Samsung")
+    summary, analyzer_result = _run_summary(
+        log_evidence,
+        brand=_brand("Samsung", "Samsung", brand_mismatch=False),
+        log_brand="Samsung",
+    )
 
     assert summary.overall_status == StepStatus.PASS
     assert summary.has_failure is False
@@ -0,0 +1 @@
+"""Command-line helpers for inspecting QA automation artifacts."""
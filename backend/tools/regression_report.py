@@ -1,7 +1,22 @@
-import json
 from pathlib import Path
 import sys
-from typing import Any, Dict, Iterable, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, TextIO, Tuple
+
+try:  # orjson parses snapshots straight from bytes, much faster when installed
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    from json import loads as _json_loads
+
+try:  # optional: lets main() stream very large snapshots
+    import ijson
+except ImportError:  # pragma: no cover - full load only
+    ijson = None
+
+try:  # optional: reads zstd-compressed snapshots (session_<id>.json.zst)
+    import zstandard
+except ImportError:  # pragma: no cover - plain JSON snapshots only
+    zstandard = None
 
 # ROOT_DIR = backend (הקובץ נמצא ב-backend/tools)
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -17,6 +32,24 @@ EVIDENCE_KEYS_ORDER: Iterable[str] = (
     "issue_confirmed_by_probe",
     "tv_brand_detected",
 )
+TV_AUTOSYNC_ANSWER_STEPS: Tuple[Tuple[str, str], ...] = (
+    ("question_tv_volume_changed", "TV volume changed"),
+    ("question_tv_osd_seen", "TV OSD seen"),
+    ("question_pairing_screen_seen", "Pairing screen seen"),
+    ("question_tv_brand_ui", "TV brand (UI)"),
+)
+# Timeline rows the report reads besides failed ones.
+REPORT_STEP_NAMES = frozenset(
+    ["analysis_summary", *(step_name for step_name, _ in TV_AUTOSYNC_ANSWER_STEPS)]
+)
+STREAMING_THRESHOLD_BYTES = 2 * 1024 * 1024
+_EVIDENCE_KEYS_SET = frozenset(EVIDENCE_KEYS_ORDER)
+_SEP = "=" * 60
+_HEADER: Tuple[str, ...] = (_SEP, "REGRESSION REPORT", _SEP)
+_TV_LABEL = "TV / Brand:"
+_VOL_LABEL = "Volume / OSD:"
+# Shared read-only stand-in for missing details/evidence dicts.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
 
 def norm_status(value: Any) -> str:
@@ -31,14 +64,14 @@ def _extract_step(timeline: List[Dict[str, Any]], name: str) -> Optional[Dict[st
 def _format_step_answer(row: Optional[Dict[str, Any]]) -> str:
     if not row:
         return "N/A"
-    answer = row.get("user_answer") or (row.get("details") or {}).get("answer")
+    answer = row.get("user_answer") or (row.get("details") or _EMPTY).get("answer")
     if not answer:
         answer = "UNKNOWN"
     status = row.get("status") or "UNKNOWN"
     return f"{str(answer).upper()} (step status: {status})"
 
 
-def _derive_analysis_reason(session: Dict[str, Any], summary_details: Dict[str, Any]) -> Optional[str]:
+def _derive_analysis_reason(session: Dict[str, Any], summary_details: Mapping[str, Any]) -> Optional[str]:
     overall = (session.get("overall_status") or "").upper()
     if overall != "FAIL":
         if summary_details.get("log_verdict") == "INCONCLUSIVE":
@@ -62,17 +95,12 @@ def _derive_analysis_reason(session: Dict[str, Any], summary_details: Dict[str,
 
 def _format_tv_autosync_sections(
     timeline: List[Dict[str, Any]],
-    summary_details: Dict[str, Any],
+    summary_details: Mapping[str, Any],
 ) -> List[str]:
     lines: List[str] = []
     lines.append("Tester verdict:")
     lines.append(f"  Overall tester verdict : {summary_details.get('tester_verdict', 'UNKNOWN')}")
-    for step_name, label in (
-        ("question_tv_volume_changed", "TV volume changed"),
-        ("question_tv_osd_seen", "TV OSD seen"),
-        ("question_pairing_screen_seen", "Pairing screen seen"),
-        ("question_tv_brand_ui", "TV brand (UI)"),
-    ):
+    for step_name, label in TV_AUTOSYNC_ANSWER_STEPS:
         step = _extract_step(timeline, step_name)
         lines.append(f"  {label:<23}: {_format_step_answer(step)}")
     lines.append("")
@@ -91,12 +119,15 @@ def _format_tv_autosync_sections(
     autosync_success = summary_details.get("autosync_success")
     if autosync_success is not None:
         lines.append(f"  Auto-sync success: {autosync_success}")
-    evidence = summary_details.get("evidence") or {}
+    evidence = summary_details.get("evidence") or _EMPTY
     if evidence:
         lines.append("  Evidence highlights:")
-        for key in EVIDENCE_KEYS_ORDER:
-            if key in evidence:
-                lines.append(f"    - {key}: {evidence[key]}")
+        # Older snapshots may carry a list or string here; only mappings have highlights.
+        hits = _EVIDENCE_KEYS_SET & evidence.keys() if isinstance(evidence, Mapping) else None
+        if hits:
+            for key in EVIDENCE_KEYS_ORDER:
+                if key in hits:
+                    lines.append(f"    - {key}: {evidence[key]}")
     lines.append("")
 
     conflict = summary_details.get("conflict_tester_vs_logs")
@@ -112,7 +143,7 @@ def _format_tv_autosync_sections(
     return lines
 
 
-def build_report_lines(data: Dict[str, Any], source_path: Optional[Path] = None) -> List[str]:
+def iter_report_lines(data: Dict[str, Any], source_path: Optional[Path] = None) -> Iterator[str]:
     session = data.get("session", {})
     timeline = data.get("timeline", [])
     has_failure = data.get("has_failure")
@@ -134,61 +165,65 @@ def build_report_lines(data: Dict[str, Any], source_path: Optional[Path] = None)
     has_osd_issue = session.get("has_osd_issue")
     analysis_text = session.get("analysis_text")
 
-    failed_events = [e for e in timeline if norm_status(e.get("status")) == "fail"]
-
-    analysis_event = _extract_step(timeline, "analysis_summary")
-    summary_details = (analysis_event or {}).get("details") or {}
+    # one pass: failed rows plus the first analysis_summary row
+    failed_events: List[Dict[str, Any]] = []
+    analysis_event: Optional[Dict[str, Any]] = None
+    for e in timeline:
+        status = e.get("status")
+        if status and status.lower() == "fail":
+            failed_events.append(e)
+        if analysis_event is None and e.get("name") == "analysis_summary":
+            analysis_event = e
+
+    summary_details = (analysis_event.get("details") if analysis_event else None) or _EMPTY
     failed_from_summary = summary_details.get("failed_steps") or []
 
-    lines: List[str] = []
-    lines.append("=" * 60)
-    lines.append("REGRESSION REPORT")
-    lines.append("=" * 60)
-    lines.append(f"Session ID   : {session_id}")
+    yield from _HEADER
+    yield f"Session ID   : {session_id}"
     if scenario:
-        lines.append(f"Scenario     : {scenario}")
+        yield f"Scenario     : {scenario}"
     if tester:
-        lines.append(f"Tester       : {tester}")
+        yield f"Tester       : {tester}"
     if stb_ip:
-        lines.append(f"STB IP       : {stb_ip}")
+        yield f"STB IP       : {stb_ip}"
     if overall_status:
-        lines.append(f"Overall      : {overall_status}")
+        yield f"Overall      : {overall_status}"
     if has_failure is not None:
-        lines.append(f"Has failure  : {has_failure}")
-    lines.append("")
+        yield f"Has failure  : {has_failure}"
+    yield ""
 
-    lines.append("TV / Brand:")
+    yield _TV_LABEL
     if tv_brand_user or tv_brand_log:
-        lines.append(f"  User brand : {tv_brand_user}")
-        lines.append(f"  Log brand  : {tv_brand_log}")
+        yield f"  User brand : {tv_brand_user}"
+        yield f"  Log brand  : {tv_brand_log}"
     if brand_mismatch is not None:
-        lines.append(f"  Mismatch   : {brand_mismatch}")
-    lines.append("")
+        yield f"  Mismatch   : {brand_mismatch}"
+    yield ""
 
-    lines.append("Volume / OSD:")
+    yield _VOL_LABEL
     if has_volume_issue is not None:
-        lines.append(f"  Volume issue: {has_volume_issue}")
+        yield f"  Volume issue: {has_volume_issue}"
     if has_osd_issue is not None:
-        lines.append(f"  OSD issue   : {has_osd_issue}")
-    lines.append("")
+        yield f"  OSD issue   : {has_osd_issue}"
+    yield ""
 
     if analysis_text:
-        lines.append("Analysis:")
-        lines.append(f"  {analysis_text}")
+        yield "Analysis:"
+        yield f"  {analysis_text}"
         reason_line = _derive_analysis_reason(session, summary_details)
         if reason_line:
-            lines.append(f"  {reason_line}")
-        lines.append("")
+            yield f"  {reason_line}"
+        yield ""
 
     if scenario == "TV_AUTO_SYNC":
-        lines.extend(_format_tv_autosync_sections(timeline, summary_details))
+        yield from _format_tv_autosync_sections(timeline, summary_details)
 
     if failed_events:
-        lines.append("Failed steps (from timeline):")
+        yield "Failed steps (from timeline):"
         for idx, e in enumerate(failed_events, start=1):
             name = e.get("name") or e.get("label") or f"step_{idx}"
             label = e.get("label") or ""
-            details = e.get("details") or {}
+            details = e.get("details") or _EMPTY
             reason = (
                 details.get("probe_mismatch_reason")
                 or details.get("mismatch_reason")
@@ -199,28 +234,98 @@ def build_report_lines(data: Dict[str, Any], source_path: Optional[Path] = None)
             disp = name
             if label and label != name:
                 disp += f" ({label})"
-            lines.append(f"  {idx}. {disp}")
+            yield f"  {idx}. {disp}"
             if reason:
-                lines.append(f"       - {reason}")
-        lines.append("")
+                yield f"       - {reason}"
+        yield ""
 
     if failed_from_summary:
-        lines.append("Failed steps (from summary.failed_steps):")
+        yield "Failed steps (from summary.failed_steps):"
         for idx, name in enumerate(failed_from_summary, start=1):
-            lines.append(f"  {idx}. {name}")
-        lines.append("")
+            yield f"  {idx}. {name}"
+        yield ""
 
     if not failed_events and not failed_from_summary:
-        lines.append("No failed steps recorded.")
-        lines.append("")
+        yield "No failed steps recorded."
+        yield ""
 
-    lines.append("Source file:")
+    yield "Source file:"
     if source_path:
-        lines.append(f"  {source_path}")
+        yield f"  {source_path}"
     else:
-        lines.append("  (in-memory data)")
+        yield "  (in-memory data)"
 
-    return lines
+
+def build_report_lines(data: Dict[str, Any], source_path: Optional[Path] = None) -> List[str]:
+    return list(iter_report_lines(data, source_path=source_path))
+
+
+def write_report(data: Dict[str, Any], out: TextIO, source_path: Optional[Path] = None) -> None:
+    """Write the report straight to ``out`` without building a line list or joined string."""
+    out.writelines(f"{line}\n" for line in iter_report_lines(data, source_path=source_path))
+
+
+def _is_report_row(row: Any) -> bool:
+    if not isinstance(row, dict):
+        return False
+    return norm_status(row.get("status")) == "fail" or row.get("name") in REPORT_STEP_NAMES
+
+
+def load_snapshot_streaming(path: Path) -> Dict[str, Any]:
+    """Parse a snapshot with ijson, keeping only the timeline rows the report uses.
+
+    Top-level values are built as usual; timeline rows are built one at a time
+    and dropped unless they failed or are read by name, so memory stays bounded
+    by the report rather than by the timeline length.
+    """
+    data: Dict[str, Any] = {}
+    timeline: List[Dict[str, Any]] = []
+    key: Optional[str] = None
+    builder = None
+    target = ""
+    with path.open("rb") as fh:
+        for prefix, event, value in ijson.parse(fh, use_float=True):
+            if builder is None:
+                if prefix == "":
+                    if event == "map_key":
+                        key = value
+                    continue
+                if prefix == "timeline" and event in ("start_array", "end_array"):
+                    data["timeline"] = timeline
+                    continue
+                builder = ijson.ObjectBuilder()
+                target = prefix
+            builder.event(event, value)
+            if prefix != target or event in ("start_map", "start_array", "map_key"):
+                continue
+            if target == "timeline.item":
+                if _is_report_row(builder.value):
+                    timeline.append(builder.value)
+            elif key is not None:
+                data[key] = builder.value
+            builder = None
+    return data
+
+
+def build_report_lines_streaming(path: Path) -> List[str]:
+    """Render the report for a snapshot file without materializing its full timeline."""
+    return list(iter_report_lines(load_snapshot_streaming(path), source_path=path))
+
+
+def snapshot_path(sid: str) -> Path:
+    """Prefer a zstd-compressed snapshot when one exists and zstandard is installed."""
+    compressed = REGRESSION_DIR / f"session_{sid}.json.zst"
+    if zstandard is not None and compressed.exists():
+        return compressed
+    return REGRESSION_DIR / f"session_{sid}.json"
+
+
+def load_snapshot(path: Path) -> Dict[str, Any]:
+    """Load a snapshot, decompressing ``.zst`` files before parsing."""
+    if path.suffix == ".zst":
+        with path.open("rb") as fh, zstandard.ZstdDecompressor().stream_reader(fh) as reader:
+            return _json_loads(reader.read())
+    return _json_loads(path.read_bytes())
 
 
 def main() -> None:
@@ -229,15 +334,18 @@ def main() -> None:
         raise SystemExit(1)
 
     sid = sys.argv[1]
-    path = REGRESSION_DIR / f"session_{sid}.json"
+    path = snapshot_path(sid)
 
     if not path.exists():
         print(f"[ERROR] Snapshot not found: {path}")
         raise SystemExit(1)
 
-    data = json.loads(path.read_text(encoding="utf-8"))
-    lines = build_report_lines(data, source_path=path)
-    print("\n".join(lines))
+    if ijson is not None and path.suffix == ".json" and path.stat().st_size > STREAMING_THRESHOLD_BYTES:
+        data = load_snapshot_streaming(path)
+    else:
+        data = load_snapshot(path)
+    # sys.stdout's own buffer batches these writes into few syscalls when piped.
+    write_report(data, sys.stdout, source_path=path)
 
 
 if __name__ == "__main__":
@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import sys
 from pathlib import Path
 from typing import Any, Dict
 
 
+@functools.cache
+def _repo_root() -> Path:
+    """Resolve the repository root once per process."""
+    return Path(__file__).resolve().parents[1]
+
+
 def _bootstrap_pythonpath() -> None:
     """Ensure that the project root is available on sys.path for imports."""
-    import sys
-
-    repo_root = Path(__file__).resolve().parents[1]
+    repo_root = _repo_root()
     if str(repo_root) not in sys.path:
         sys.path.insert(0, str(repo_root))
 
@@ -22,16 +28,20 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--session-id", required=True, help="Session identifier.")
     parser.add_argument("--stb-ip", required=True, help="STB IP:PORT for adb.")
     parser.add_argument("--scenario", required=True, help="Scenario name, e.g. TV_AUTO_SYNC.")
+    parser.add_argument(
+        "--report",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Print the regression report for the session in the same process.",
+    )
     return parser.parse_args()
 
 
-def main() -> None:
-    """Entry point that coordinates argument parsing and scenario execution."""
-    _bootstrap_pythonpath()
+def run_and_report(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the scenario and, with --report, render its regression report in-process."""
     from src.qa.session_runner import SessionRunner  # type: ignore
 
-    args = parse_args()
-    project_root = Path(__file__).resolve().parents[1]
+    project_root = _repo_root()
     runner = SessionRunner(project_root)
     result: Dict[str, Any] = runner.run(
         session_id=args.session_id,
@@ -53,6 +63,25 @@ def main() -> None:
     print(f"Steps JSONL: {result.get('session_log_path')}")
     print(f"Raw log: {result.get('raw_log_path')}")
 
+    if args.report:
+        from backend.tools import regression_report  # type: ignore
+
+        snapshot = regression_report.snapshot_path(args.session_id)
+        if snapshot.exists():
+            print()
+            regression_report.write_report(
+                regression_report.load_snapshot(snapshot), sys.stdout, source_path=snapshot
+            )
+        else:
+            print(f"Regression report: no snapshot at {snapshot}")
+    return result
+
+
+def main() -> None:
+    """Entry point that coordinates argument parsing and scenario execution."""
+    _bootstrap_pythonpath()
+    run_and_report(parse_args())
+
 
 if __name__ == "__main__":
     main()
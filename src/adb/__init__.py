@@ -1,11 +1,12 @@
 """Expose adb helper utilities."""
 
 from .adb_client import ADBClient, ADBError
-from .device_discovery import list_connected_devices, find_device_by_ip
+from .device_discovery import list_connected_devices, find_device_by_ip, clear_device_lookup_cache
 
 __all__ = [
     "ADBClient",
     "ADBError",
     "list_connected_devices",
     "find_device_by_ip",
+    "clear_device_lookup_cache",
 ]
@@ -1,10 +1,33 @@
 # File: src/adb/adb_client.py
 from __future__ import annotations
 
+import os
+import re
+import shlex
 import subprocess
+import threading
 import time
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+# "<serial>\t<state>" rows of 'adb devices'; [ \t] keeps a match on one line.
+_DEVICES_RE = re.compile(r"^[ \t]*(\S+)[ \t]+(\S+)", re.M)
+_DEVICES_HEADER = "List of devices attached"
+# How long a confirmed 'device' state lets ensure_connected skip adb entirely.
+CONNECTED_STATE_TTL = 5.0
+# Device-side directory for the per-session file that keeps stderr of
+# persistent-shell commands out of stdout.
+_SHELL_STDERR_DIR = "/data/local/tmp"
+
+
+class _ShellSessionClosed(Exception):
+    """The persistent adb shell could not take the command; nothing ran, so a one-shot run is safe."""
+
+
+class _ShellSessionLost(Exception):
+    """The persistent adb shell died after the command was sent; it may already have run."""
 
 
 class ADBError(RuntimeError):
@@ -35,8 +58,9 @@ class ADBClient:
     ) -> None:
         """
         :param target: IP or IP:PORT of the STB, e.g. '192.168.1.200' or '192.168.1.200:5555'
-        :param max_retries: how many times to retry adb connect
-        :param retry_delay: delay (seconds) between retries
+        :param max_retries: how many times to retry adb connect; with retry_delay it
+            sets the total retry window, retry_delay * (max_retries - 1) seconds
+        :param retry_delay: upper bound (seconds) on the backoff between retries
         :param adb_path: path to adb binary
         """
         self.raw_target = target.strip()
@@ -45,6 +69,16 @@ class ADBClient:
         self.retry_delay = retry_delay
         self.adb_path = adb_path
         self._logcat_proc: Optional[subprocess.Popen] = None
+        self._connected_at: Optional[float] = None
+        self._shell_session: Optional[subprocess.Popen] = None
+        self._shell_stderr_path = ""
+        self._shell_lock = threading.Lock()
+
+    def __del__(self) -> None:
+        try:
+            self.close_shell_session()
+        except Exception:
+            pass
 
     # ----------------------------------------------------------------------
     # Internal helpers
@@ -60,17 +94,18 @@ class ADBClient:
             return target
         return f"{target}:5555"
 
-    def _run_adb(self, *args: str, check: bool = False) -> subprocess.CompletedProcess:
+    def _run_adb(self, *args: str, check: bool = False, text: bool = True) -> subprocess.CompletedProcess:
         """
         Run an adb command and return the CompletedProcess.
         Raises ADBError if check=True and returncode != 0.
+        With text=False, stdout/stderr are left as raw bytes.
         """
         cmd = [self.adb_path, *args]
         try:
             proc = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
+                text=text,
                 check=False,
             )
         except FileNotFoundError as exc:
@@ -98,17 +133,117 @@ class ADBClient:
         """
         Parse 'adb devices' output into a {serial: status} dict.
         """
-        devices: dict[str, str] = {}
-        for line in output.splitlines():
-            line = line.strip()
-            if not line or line.startswith("List of devices attached"):
-                continue
-            # Expected format: "<serial>\t<state>"
-            parts = line.split()
-            if len(parts) >= 2:
-                serial, state = parts[0], parts[1]
-                devices[serial] = state
-        return devices
+        # Skip everything up to and including the header line.
+        start = 0
+        header = output.find(_DEVICES_HEADER)
+        if header >= 0:
+            line_end = output.find("\n", header)
+            start = len(output) if line_end < 0 else line_end + 1
+        return {match.group(1): match.group(2) for match in _DEVICES_RE.finditer(output, start)}
+
+    def _open_shell_session(self) -> subprocess.Popen:
+        """
+        Return the long-lived 'adb -s <target> shell' process, starting it if needed.
+        -T disables the PTY so commands are not echoed back on stdout.
+
+        Each session writes stderr to its own file, so concurrent sessions on one
+        device never report each other's stderr. If that file cannot be created,
+        the shell variable $__qa_stderr points at /dev/null instead and commands
+        still run, only without stderr in failure reports.
+        """
+        proc = self._shell_session
+        if proc is not None and proc.poll() is None:
+            return proc
+        try:
+            proc = subprocess.Popen(
+                [self.adb_path, "-s", self.target, "shell", "-T"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except OSError as exc:
+            raise _ShellSessionClosed(str(exc)) from exc
+        self._shell_session = proc
+        self._shell_stderr_path = f"{_SHELL_STDERR_DIR}/.qa_adb_shell_stderr_{uuid.uuid4().hex}"
+        try:
+            # A failed redirection may end a non-interactive shell, hence the subshell.
+            proc.stdin.write(
+                f"__qa_stderr={self._shell_stderr_path}\n"
+                '( : >"$__qa_stderr" ) 2>/dev/null || __qa_stderr=/dev/null\n'
+            )
+            proc.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as exc:
+            self.close_shell_session()
+            raise _ShellSessionClosed(str(exc)) from exc
+        return proc
+
+    def _shell_session_run(self, command: str, capture_stderr: bool) -> tuple[int, str]:
+        """
+        Run one command on the persistent shell and return (exit_code, stdout).
+        The command runs in a subshell, so cd/export/exit cannot leak into later
+        calls, and with stdin from /dev/null so it cannot swallow the following input.
+        Each call gets its own end marker, and any failure while reading closes the
+        session, so output left over from one command is never read as another's.
+        """
+        proc = self._open_shell_session()
+        stderr_target = '"$__qa_stderr"' if capture_stderr else "/dev/null"
+        sentinel = f"__qa_adb_done_{uuid.uuid4().hex}__"
+        script = (
+            f"( {command}\n) </dev/null 2>{stderr_target}\n"
+            f"printf '\\n{sentinel} %s\\n' \"$?\"\n"
+        )
+        try:
+            proc.stdin.write(script)
+            proc.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as exc:
+            raise _ShellSessionClosed(str(exc)) from exc
+        except BaseException:
+            # Part of the script may have reached the shell.
+            self.close_shell_session()
+            raise
+
+        chunks: list[str] = []
+        prefix = f"{sentinel} "
+        try:
+            while True:
+                line = proc.stdout.readline()
+                if not line:
+                    raise _ShellSessionLost("adb shell exited")
+                if line.startswith(prefix):
+                    code = line[len(prefix):].strip()
+                    if code.isdigit():
+                        break
+                chunks.append(line)
+        except BaseException:
+            # Undecodable output, an interrupt, or EOF: the rest of this command's
+            # output is still unread, so the session cannot be reused.
+            self.close_shell_session()
+            raise
+        # Drop the newline printf emits ahead of the sentinel.
+        output = "".join(chunks)
+        return int(code), output[:-1] if output.endswith("\n") else output
+
+    def close_shell_session(self) -> None:
+        """
+        Terminate the persistent shell used by shell(), if one is running, and
+        remove its stderr file.
+        """
+        proc = self._shell_session
+        self._shell_session = None
+        if proc is None:
+            return
+        if proc.poll() is None:
+            try:
+                proc.stdin.write(f"rm -f {self._shell_stderr_path}\n")
+                proc.stdin.close()
+                proc.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                proc.kill()
+                proc.wait()
+        if proc.stdout is not None:
+            proc.stdout.close()
 
     def _connect_once(self) -> tuple[bool, str]:
         """
@@ -128,10 +263,24 @@ class ADBClient:
         Run 'adb devices' and return the state for self.target if present,
         or empty string if not present.
         """
-        proc = self._run_adb("devices", check=False)
-        devices = self._parse_devices_output(proc.stdout or "")
-        # adb devices will show the serial as "<ip>:<port>"
-        return devices.get(self.target, "")
+        proc = self._run_adb("devices", check=False, text=False)
+        buf: bytes = proc.stdout or b""
+        # adb devices will show the serial as "<ip>:<port>"; only the state token
+        # after "\n<target>\t" is decoded.
+        needle = self.target.encode() + b"\t"
+        if buf.startswith(needle):
+            start = len(needle)
+        else:
+            idx = buf.find(b"\n" + needle)
+            if idx < 0:
+                return ""
+            start = idx + 1 + len(needle)
+        end = start
+        while end < len(buf) and buf[end] not in b" \t\r\n":
+            end += 1
+        if end == start:
+            return self._parse_devices_output(buf.decode(errors="replace")).get(self.target, "")
+        return buf[start:end].decode(errors="replace")
 
     # ----------------------------------------------------------------------
     # Public API used by the rest of the project
@@ -146,19 +295,40 @@ class ADBClient:
         This method will:
         - Retry a few times.
         - Raise ADBError with a clear message if it cannot reach 'device' state.
+
+        When the target is already attached (checked within CONNECTED_STATE_TTL,
+        or visible in 'adb devices'), it returns without start-server/connect.
         """
+        if self._connected_at is not None and time.monotonic() - self._connected_at < CONNECTED_STATE_TTL:
+            return
+        try:
+            if self._check_device_state() == "device":
+                self._connected_at = time.monotonic()
+                return
+        except ADBError:
+            pass
+        self._connected_at = None
+
         self._ensure_server_running()
 
         last_msg = ""
-        for attempt in range(1, self.max_retries + 1):
+        # Poll with a short exponential backoff (0.2s, 0.4s, ... capped at retry_delay),
+        # but keep retrying for the same total wait the fixed retry_delay schedule
+        # gave: retry_delay * (max_retries - 1). An STB still booting needs that long.
+        deadline = time.monotonic() + self.retry_delay * (self.max_retries - 1)
+        attempt = 0
+        while True:
+            attempt += 1
             ok, msg = self._connect_once()
             last_msg = msg
-            # Give adb a moment to update internal state
-            time.sleep(0.5)
+            if "already connected" not in msg:
+                # Give adb a moment to update internal state
+                time.sleep(0.5)
             state = self._check_device_state()
 
             if state == "device":
                 # We're good.
+                self._connected_at = time.monotonic()
                 return
 
             if state == "unauthorized":
@@ -168,15 +338,16 @@ class ADBClient:
                     "'Always allow', then rerun the test."
                 )
 
-            # If state is 'offline' or empty, we can retry
-            if attempt < self.max_retries:
-                time.sleep(self.retry_delay)
-                continue
+            # If state is 'offline' or empty, we can retry until the deadline
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(self.retry_delay, 0.1 * 2 ** min(attempt, 10), remaining))
 
         # If we got here, we never reached 'device' state.
         raise ADBError(
             f"Failed to connect to STB over ADB at {self.target} after "
-            f"{self.max_retries} attempts.\n"
+            f"{attempt} attempts.\n"
             f"Last adb connect output:\n{last_msg or '[no output]'}\n"
             "Make sure:\n"
             "  - The STB is powered on and on the same network.\n"
@@ -194,36 +365,99 @@ class ADBClient:
         log_path.parent.mkdir(parents=True, exist_ok=True)
         # Use -v time for stable timestamps; adjust as needed.
         cmd = [self.adb_path, "-s", self.target, "logcat", "-v", "time"]
-        # Open the file and stream logcat output into it
-        log_file = open(log_path, "w", encoding="utf-8", errors="ignore")
-        proc = subprocess.Popen(
-            cmd,
-            stdout=log_file,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
+        # adb writes straight into the file through the inherited descriptor; the
+        # parent's copy is closed right away so it does not leak per capture.
+        log_fd = os.open(str(log_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=log_fd,
+                stderr=subprocess.STDOUT,
+            )
+        finally:
+            os.close(log_fd)
         self._logcat_proc = proc
         return proc
 
+    @staticmethod
+    def _stop_process(proc: subprocess.Popen, timeout: float = 5) -> None:
+        """Terminate proc and reap it, escalating to kill() if it ignores SIGTERM."""
+        if proc.poll() is not None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
     def stop_logcat_capture(self) -> None:
         """
         Stop an ongoing logcat capture if started via start_logcat_capture.
         """
         if self._logcat_proc is None:
             return
-        if self._logcat_proc.poll() is None:
-            # Still running; try to terminate
-            self._logcat_proc.terminate()
-            try:
-                self._logcat_proc.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self._logcat_proc.kill()
+        self._stop_process(self._logcat_proc)
         self._logcat_proc = None
 
+    @contextmanager
+    def logcat_capture(self, log_path: Path) -> Iterator[subprocess.Popen]:
+        """
+        Capture logcat into log_path for the duration of the with-block.
+
+        The process is stopped and reaped on exit, even if the block raises.
+        """
+        proc = self.start_logcat_capture(log_path)
+        try:
+            yield proc
+        finally:
+            self._stop_process(proc, timeout=1.0)
+            if self._logcat_proc is proc:
+                self._logcat_proc = None
+
     # Optional helper for generic shell commands, in case scenarios need it:
     def shell(self, command: str, check: bool = True) -> str:
         """
         Run 'adb -s <target> shell <command>' and return stdout.
+
+        Commands go through one persistent adb shell instead of spawning adb per
+        call. If the command cannot be handed to that shell, this call falls back
+        to a one-shot adb run. If the shell dies after the command was sent
+        (reboot, device offline), ADBError is raised rather than replaying a
+        command that may already have run. Either way the next call starts a
+        fresh session.
         """
-        proc = self._run_adb("-s", self.target, "shell", command, check=check)
-        return proc.stdout or ""
+        try:
+            shlex.split(command)
+        except ValueError:
+            # Unbalanced quoting would leave the persistent shell waiting for input.
+            proc = self._run_adb("-s", self.target, "shell", command, check=check)
+            return proc.stdout or ""
+        with self._shell_lock:
+            try:
+                code, output = self._shell_session_run(command, capture_stderr=check)
+            except _ShellSessionClosed:
+                self.close_shell_session()
+                proc = self._run_adb("-s", self.target, "shell", command, check=check)
+                return proc.stdout or ""
+            except _ShellSessionLost as exc:
+                self.close_shell_session()
+                raise ADBError(
+                    f"ADB shell session lost while running: {self.adb_path} -s {self.target} "
+                    f"shell {command}\n(the command may have run on the device)"
+                ) from exc
+            stderr = ""
+            if check and code != 0:
+                try:
+                    _, stderr = self._shell_session_run('cat "$__qa_stderr"', capture_stderr=False)
+                except (_ShellSessionClosed, _ShellSessionLost):
+                    # The failure itself is known; only its stderr is unavailable.
+                    self.close_shell_session()
+        if check and code != 0:
+            raise ADBError(
+                f"ADB command failed: {self.adb_path} -s {self.target} shell {command}\n"
+                f"exit code: {code}\n"
+                f"stdout:\n{output}\n"
+                f"stderr:\n{stderr}\n"
+            )
+        return output
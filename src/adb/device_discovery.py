@@ -4,11 +4,18 @@ from __future__ import annotations
 
 import re
 import subprocess
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 
 ADB_LINE_PATTERN = re.compile(
     r"^(?P<serial>[^\s]+)\s+(?P<state>device|offline|unauthorized)\s*(?P<details>.*)$"
 )
+# States accepted by ADB_LINE_PATTERN, for token-level checks without the regex.
+ADB_DEVICE_STATES = frozenset(("device", "offline", "unauthorized"))
+# Devices found by find_device_by_ip are reused for this many seconds per
+# (ip_or_serial, adb_path); misses are never cached.
+DEVICE_LOOKUP_TTL = 2.0
+_DEVICE_LOOKUP_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, str]]] = {}
 
 
 def list_connected_devices(adb_path: str = "adb") -> List[Dict[str, str]]:
@@ -27,19 +34,40 @@ def list_connected_devices(adb_path: str = "adb") -> List[Dict[str, str]]:
 
     devices: List[Dict[str, str]] = []
     for line in result.stdout.splitlines():
-        line = line.strip()
-        if not line or line.startswith("List of devices"):
+        # "<serial> <state> [details...]"; headers and daemon notices fail the state check
+        parts = line.split(None, 2)
+        if len(parts) < 2 or parts[1] not in ADB_DEVICE_STATES:
             continue
-        match = ADB_LINE_PATTERN.match(line)
-        if not match:
-            continue
-        devices.append(match.groupdict())
+        devices.append(
+            {
+                "serial": parts[0],
+                "state": parts[1],
+                "details": parts[2].strip() if len(parts) > 2 else "",
+            }
+        )
     return devices
 
 
 def find_device_by_ip(ip_or_serial: str, adb_path: str = "adb") -> Optional[Dict[str, str]]:
-    """Return the first device whose serial or details match the requested IP."""
+    """Return the first device whose serial or details match the requested IP.
+
+    Found devices are cached for DEVICE_LOOKUP_TTL seconds; call
+    clear_device_lookup_cache() to force a fresh `adb devices -l`.
+    """
+    key = (ip_or_serial, adb_path)
+    now = time.monotonic()
+    hit = _DEVICE_LOOKUP_CACHE.get(key)
+    if hit is not None and now - hit[0] < DEVICE_LOOKUP_TTL:
+        return dict(hit[1])
+
     for device in list_connected_devices(adb_path=adb_path):
         if device["serial"] == ip_or_serial or ip_or_serial in device.get("details", ""):
-            return device
+            _DEVICE_LOOKUP_CACHE[key] = (now, device)
+            return dict(device)
+    _DEVICE_LOOKUP_CACHE.pop(key, None)
     return None
+
+
+def clear_device_lookup_cache() -> None:
+    """Drop every cached find_device_by_ip result."""
+    _DEVICE_LOOKUP_CACHE.clear()
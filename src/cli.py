@@ -1,30 +1,34 @@
 # File: src/cli.py
 from __future__ import annotations
 
+import functools
 import json
+from collections import Counter
 from datetime import datetime, timezone
+from operator import methodcaller
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
 import typer
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
-from src.qa.pattern_memory import (
-    append_pattern_entry,
-    build_historical_summary,
-    build_pattern_entry,
-    load_pattern_memory,
-)
-from src.qa.report_generator import generate_markdown_report
-from src.qa.session_runner import SessionRunner
 
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+
+# Rich and the QA runner modules are imported inside the commands that use
+# them, so `--help` and `summarize` start without loading them.
 app = typer.Typer(help="QuickSet QA automation CLI")
-console = Console()
+# Same as lambda step: step.get("status"), minus the Python frame per call.
+_get_status = methodcaller("get", "status")
+
+
+@functools.cache
+def _console() -> "Console":
+    from rich.console import Console
 
+    return Console()
 
+
+@functools.cache
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
@@ -33,23 +37,21 @@ def _load_steps(jsonl_path: Path) -> List[Dict[str, Any]]:
     if not jsonl_path.exists():
         return []
     steps: List[Dict[str, Any]] = []
-    with jsonl_path.open("r", encoding="utf-8") as handle:
+    # Binary line iteration splits on b"\n" in C; json.loads takes the bytes as-is.
+    with jsonl_path.open("rb") as handle:
         for line in handle:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
             try:
                 steps.append(json.loads(line))
-            except json.JSONDecodeError:
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 continue
     return steps
 
 
 def _summarize_steps(steps: List[Dict[str, Any]]) -> Dict[str, int]:
-    total = len(steps)
-    passed = sum(1 for step in steps if step.get("status") == "PASS")
-    failed = sum(1 for step in steps if step.get("status") == "FAIL")
-    return {"total": total, "pass": passed, "fail": failed}
+    status_counts = Counter(map(_get_status, steps))
+    return {"total": len(steps), "pass": status_counts["PASS"], "fail": status_counts["FAIL"]}
 
 
 def format_summary(result: Dict[str, Any]) -> str:
@@ -66,6 +68,16 @@ def run_scenario(
     stb_ip: str = typer.Option(..., "--stb-ip", help="STB IP:PORT for adb."),
     scenario: str = typer.Option(..., "--scenario", help="Scenario name."),
 ) -> None:
+    from rich import box
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from src.qa.pattern_memory import append_pattern_entry, build_historical_summary, build_pattern_entry
+    from src.qa.report_generator import generate_markdown_report
+    from src.qa.session_runner import SessionRunner
+
+    console = _console()
     root = _project_root()
     runner = SessionRunner(root)
     session_output = runner.run(session_id=session_id, stb_ip=stb_ip, scenario_name=scenario)
@@ -84,7 +96,8 @@ def run_scenario(
     tv_brand_ui = scenario_result.get("tv_brand_ui")
     tv_brand_logs = scenario_result.get("tv_brand_logs")
     matched_sigs = scenario_result.get("auto_evidence", {}).get("matched_signatures") or []
-    matched_sig_ids = [sig.get("id") for sig in matched_sigs if sig.get("id")]
+    # Deduplicated, first-seen order; a signature counts once per run in pattern memory.
+    matched_sig_ids = list(dict.fromkeys(sig_id for sig in matched_sigs if (sig_id := sig.get("id"))))
     status = scenario_result.get("status", "UNKNOWN")
     root_cause = scenario_result.get("root_cause_category", "UNKNOWN")
 
@@ -103,16 +116,17 @@ def run_scenario(
     historical_summary = build_historical_summary(memory, scenario_id, stb_target=stb_ip, tv_brand_ui=tv_brand_ui)
     scenario_result["pattern_memory_summary"] = historical_summary
 
-    generate_markdown_report(steps_path, scenario_result, report_path, raw_log_path=raw_log_path)
+    generate_markdown_report(steps_path, scenario_result, report_path, raw_log_path=raw_log_path, steps=steps)
 
-    console.print(
+    # Everything is collected and printed as one Group: one layout pass, one write.
+    output: List[RenderableType] = [
         Panel(
             format_summary(scenario_result),
             title="QuickSet Scenario Summary",
             subtitle=f"Session: {session_id}",
             expand=False,
         )
-    )
+    ]
 
     tv_table = Table(title="TV Identity", box=box.SIMPLE_HEAVY)
     tv_table.add_column("Source")
@@ -120,7 +134,7 @@ def run_scenario(
     tv_table.add_row("Brand (UI)", str(tv_brand_ui or "N/A"))
     tv_table.add_row("Brand (logs)", str(tv_brand_logs or "N/A"))
     tv_table.add_row("Model (logs)", str(scenario_result.get("tv_model_logs") or "N/A"))
-    console.print(tv_table)
+    output.append(tv_table)
 
     volume_probe = scenario_result.get("volume_probe") or {}
     probe_table = Table(title="Volume Probe", box=box.MINIMAL_HEAVY_HEAD)
@@ -129,14 +143,14 @@ def run_scenario(
     probe_table.add_row("Volume Source", str(volume_probe.get("volume_source", "UNKNOWN")))
     confidence = volume_probe.get("confidence")
     probe_table.add_row("Confidence", f"{confidence:.2f}" if isinstance(confidence, (int, float)) else "N/A")
-    console.print(probe_table)
+    output.append(probe_table)
 
     overview = Table(title="Steps Overview", box=box.SIMPLE_HEAVY)
     overview.add_column("Total")
     overview.add_column("PASS", style="green")
     overview.add_column("FAIL", style="red")
     overview.add_row(str(step_counts["total"]), str(step_counts["pass"]), str(step_counts["fail"]))
-    console.print(overview)
+    output.append(overview)
 
     evidence = scenario_result.get("auto_evidence", {})
     sig_table = Table(title="Matched Signatures", box=box.MINIMAL_HEAVY_HEAD)
@@ -149,7 +163,7 @@ def run_scenario(
             str(sig.get("category", "")),
             str(sig.get("severity", "")),
         )
-    console.print(sig_table)
+    output.append(sig_table)
 
     state_diff = scenario_result.get("state_diff") or {}
     changed = state_diff.get("changed") or {}
@@ -160,14 +174,14 @@ def run_scenario(
         diff_table.add_column("After")
         for key, diff in changed.items():
             diff_table.add_row(key, str(diff.get("before")), str(diff.get("after")))
-        console.print(diff_table)
+        output.append(diff_table)
     if state_diff.get("unchanged"):
         unchanged_list = ", ".join(state_diff["unchanged"])
-        console.print(f"Unchanged keys: {unchanged_list}")
+        output.append(f"Unchanged keys: {unchanged_list}")
 
-    console.print(f"Terminal state: {evidence.get('terminal_state', 'unknown')}")
-    console.print(f"Steps JSONL: {steps_path}")
-    console.print(f"Report saved to: {report_path}")
+    output.append(f"Terminal state: {evidence.get('terminal_state', 'unknown')}")
+    output.append(f"Steps JSONL: {steps_path}")
+    output.append(f"Report saved to: {report_path}")
 
     historical = scenario_result.get("pattern_memory_summary") or {}
     if historical:
@@ -178,12 +192,12 @@ def run_scenario(
         hist_table.add_row("Failures (scenario)", str(historical.get("total_failures_for_scenario", 0)))
         hist_table.add_row("Runs for this STB", str(historical.get("runs_for_this_stb", 0)))
         hist_table.add_row("Failures for this STB", str(historical.get("failures_for_this_stb", 0)))
-        console.print(hist_table)
+        output.append(hist_table)
 
     suggested_actions = scenario_result.get("suggested_actions") or []
     if suggested_actions:
         actions_text = "\n".join(f"- {action}" for action in suggested_actions)
-        console.print(
+        output.append(
             Panel(
                 actions_text,
                 title="Suggested Next Steps",
@@ -192,12 +206,17 @@ def run_scenario(
             )
         )
 
+    console.print(Group(*output))
+
 
 @app.command("summarize")
 def summarize_session(
     session_id: str = typer.Option(..., "--session-id", help="Session identifier."),
     scenario: str = typer.Option("TV_AUTO_SYNC", "--scenario", help="Scenario name."),
 ) -> None:
+    from rich.panel import Panel
+
+    console = _console()
     root = _project_root()
     report_path = root / "logs" / "reports" / f"{session_id}_{scenario.lower()}.md"
     if report_path.exists():
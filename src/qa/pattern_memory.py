@@ -1,46 +1,124 @@
 # File: src/qa/pattern_memory.py
 from __future__ import annotations
 
+import functools
 import json
+import os
+import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Any, BinaryIO, Dict, List, Optional
 
-MEMORY_RELATIVE_PATH = Path("logs/analytics/pattern_memory.json")
+try:  # POSIX advisory locks serialize concurrent appenders
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
 
+try:  # orjson reads and writes JSONL lines as UTF-8 bytes when installed
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
-def _ensure_memory_file(path: Path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if not path.exists():
-        path.write_text(json.dumps({"entries": []}, indent=2), encoding="utf-8")
+MEMORY_RELATIVE_PATH = Path("logs/analytics/pattern_memory.jsonl")
+# Pre-JSONL store ({"entries": [...]}); migrated once into MEMORY_RELATIVE_PATH.
+LEGACY_MEMORY_RELATIVE_PATH = Path("logs/analytics/pattern_memory.json")
+# Small-vocabulary fields interned so entries share one str object per value.
+_INTERNED_FIELDS = ("scenario_id", "status", "root_cause_category")
+_UTC = timezone.utc
 
 
-def load_pattern_memory(project_root: Path) -> Dict[str, Any]:
-    memory_path = (project_root / MEMORY_RELATIVE_PATH).resolve()
-    _ensure_memory_file(memory_path)
+def _intern_fields(entry: Dict[str, Any]) -> Dict[str, Any]:
+    for key in _INTERNED_FIELDS:
+        value = entry.get(key)
+        if type(value) is str:
+            entry[key] = sys.intern(value)
+    return entry
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _encode_line(entry: Dict[str, Any]) -> bytes:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+
+else:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
+
+    def _encode_line(entry: Dict[str, Any]) -> bytes:
+        return json.dumps(entry).encode("utf-8") + b"\n"
+
+
+def _load_legacy_entries(path: Path) -> List[Dict[str, Any]]:
     try:
-        with memory_path.open("r", encoding="utf-8") as handle:
+        with path.open("r", encoding="utf-8") as handle:
             data = json.load(handle)
-            if not isinstance(data, dict) or "entries" not in data:
-                raise ValueError("Invalid pattern memory structure")
-            if not isinstance(data["entries"], list):
-                raise ValueError("Pattern memory entries must be a list")
-            return data
-    except Exception:
+    except (OSError, ValueError):
+        return []
+    entries = data.get("entries") if isinstance(data, dict) else None
+    return [e for e in entries if isinstance(e, dict)] if isinstance(entries, list) else []
+
+
+@functools.lru_cache(maxsize=4)
+def _memory_path(project_root: Path) -> Path:
+    return (project_root / MEMORY_RELATIVE_PATH).resolve()
+
+
+def _ensure_memory_file(project_root: Path) -> Path:
+    memory_path = _memory_path(project_root)
+    if memory_path.exists():
+        return memory_path
+    memory_path.parent.mkdir(parents=True, exist_ok=True)
+    legacy_entries = _load_legacy_entries((project_root / LEGACY_MEMORY_RELATIVE_PATH).resolve())
+    # Build the file aside and link it into place: readers never see a partial
+    # migration, and if another session created the store first its copy wins.
+    with tempfile.NamedTemporaryFile("wb", dir=memory_path.parent, delete=False) as tmp:
+        tmp.writelines(map(_encode_line, legacy_entries))
+    try:
+        os.link(tmp.name, memory_path)
+    except FileExistsError:
+        pass
+    finally:
+        os.unlink(tmp.name)
+    return memory_path
+
+
+def _read_entries(handle: BinaryIO) -> List[Dict[str, Any]]:
+    entries: List[Dict[str, Any]] = []
+    for line in handle:
+        if line.isspace():
+            continue
+        try:
+            entry = _json_loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict):
+            entries.append(_intern_fields(entry))
+    return entries
+
+
+def load_pattern_memory(project_root: Path) -> Dict[str, Any]:
+    memory_path = _ensure_memory_file(project_root)
+    try:
+        with memory_path.open("rb") as handle:
+            return {"entries": _read_entries(handle)}
+    except OSError:
         return {"entries": []}
 
 
 def append_pattern_entry(project_root: Path, entry: Dict[str, Any]) -> Dict[str, Any]:
-    memory_path = (project_root / MEMORY_RELATIVE_PATH).resolve()
-    _ensure_memory_file(memory_path)
-
-    data = load_pattern_memory(project_root)
-    entries = data.get("entries", [])
+    """Append one entry to the JSONL store and return the full memory including it."""
+    memory_path = _ensure_memory_file(project_root)
+    # One handle for both: read the history from the start, then append (a+ always
+    # writes at the end). Earlier entries are never re-serialized.
+    with memory_path.open("a+b") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)  # released when the handle closes
+        handle.seek(0)
+        entries = _read_entries(handle)
+        handle.write(_encode_line(entry))
     entries.append(entry)
-    data["entries"] = entries
-    with memory_path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2)
-    return data
+    return {"entries": entries}
 
 
 def build_historical_summary(
@@ -49,29 +127,28 @@ def build_historical_summary(
     stb_target: Optional[str] = None,
     tv_brand_ui: Optional[str] = None,
 ) -> Dict[str, Any]:
-    entries = memory.get("entries", [])
-    scenario_entries = [e for e in entries if e.get("scenario_id") == scenario_id]
-
-    total_runs = len(scenario_entries)
-    total_failures = sum(1 for e in scenario_entries if e.get("status") == "FAIL")
-
+    total_runs = total_failures = 0
+    runs_for_stb = fails_for_stb = 0
+    runs_for_brand = fails_for_brand = 0
     root_cause_counts: Dict[str, int] = {}
     sig_counts: Dict[str, int] = {}
-    for entry in scenario_entries:
+    # One pass over the history; STB/brand counters are filtered subsets of the scenario runs.
+    for entry in memory.get("entries", []):
+        if entry.get("scenario_id") != scenario_id:
+            continue
+        failed = entry.get("status") == "FAIL"
+        total_runs += 1
+        total_failures += failed
         root = entry.get("root_cause_category", "UNKNOWN")
         root_cause_counts[root] = root_cause_counts.get(root, 0) + 1
         for sig_id in entry.get("matched_signatures", []) or []:
             sig_counts[sig_id] = sig_counts.get(sig_id, 0) + 1
-
-    stb_entries = scenario_entries
-    if stb_target:
-        stb_entries = [e for e in stb_entries if e.get("stb_target") == stb_target]
-    runs_for_stb = len(stb_entries)
-    fails_for_stb = sum(1 for e in stb_entries if e.get("status") == "FAIL")
-
-    brand_entries = scenario_entries
-    if tv_brand_ui:
-        brand_entries = [e for e in brand_entries if e.get("tv_brand_ui") == tv_brand_ui]
+        if not stb_target or entry.get("stb_target") == stb_target:
+            runs_for_stb += 1
+            fails_for_stb += failed
+        if not tv_brand_ui or entry.get("tv_brand_ui") == tv_brand_ui:
+            runs_for_brand += 1
+            fails_for_brand += failed
 
     return {
         "scenario_id": scenario_id,
@@ -81,8 +158,8 @@ def build_historical_summary(
         "signature_counts": sig_counts,
         "runs_for_this_stb": runs_for_stb,
         "failures_for_this_stb": fails_for_stb,
-        "runs_for_this_brand_ui": len(brand_entries),
-        "failures_for_this_brand_ui": sum(1 for e in brand_entries if e.get("status") == "FAIL"),
+        "runs_for_this_brand_ui": runs_for_brand,
+        "failures_for_this_brand_ui": fails_for_brand,
     }
 
 
@@ -98,8 +175,8 @@ def build_pattern_entry(
     timestamp: Optional[str] = None,
 ) -> Dict[str, Any]:
     if not timestamp:
-        timestamp = datetime.now(timezone.utc).isoformat()
-    return {
+        timestamp = datetime.now(_UTC).isoformat()
+    return _intern_fields({
         "timestamp": timestamp,
         "scenario_id": scenario_id,
         "session_id": session_id,
@@ -109,4 +186,4 @@ def build_pattern_entry(
         "matched_signatures": matched_signatures,
         "tv_brand_ui": tv_brand_ui,
         "tv_brand_logs": tv_brand_logs,
-    }
+    })
@@ -1,41 +1,43 @@
 # File: src/qa/report_generator.py
 from __future__ import annotations
 
+from collections import Counter
+from operator import methodcaller
 from pathlib import Path
 from typing import Any, Dict, List
 
-import textwrap
+try:  # orjson parses JSONL lines straight from bytes when installed
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    from json import loads as _json_loads
+
+# step.get("status") as a C-level callable, so status counting runs without a Python frame per step.
+_get_status = methodcaller("get", "status")
+STEPS_SUMMARY_TEMPLATE = "## Steps Summary\n\n- Total steps recorded: {total}\n- PASS: {passes}\n- FAIL: {fails}"
 
 
 def _read_jsonl_steps(path: Path) -> List[Dict[str, Any]]:
     steps: List[Dict[str, Any]] = []
     if not path.exists():
         return steps
-    with path.open("r", encoding="utf-8") as handle:
+    with path.open("rb") as handle:
         for line in handle:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
             try:
-                steps.append(eval(line))  # noqa: S307
-            except Exception:
+                steps.append(_json_loads(line))
+            except ValueError:
                 continue
     return steps
 
 
 def _format_steps_summary(steps: List[Dict[str, Any]]) -> str:
-    total = len(steps)
-    passes = sum(1 for step in steps if step.get("status") == "PASS")
-    fails = sum(1 for step in steps if step.get("status") == "FAIL")
-    return textwrap.dedent(
-        f"""
-        ## Steps Summary
-
-        - Total steps recorded: {total}
-        - PASS: {passes}
-        - FAIL: {fails}
-        """
-    ).strip()
+    status_counts = Counter(map(_get_status, steps))
+    return STEPS_SUMMARY_TEMPLATE.format(
+        total=len(steps),
+        passes=status_counts["PASS"],
+        fails=status_counts["FAIL"],
+    )
 
 
 def _render_historical_context(summary: Dict[str, Any]) -> str:
@@ -59,18 +61,36 @@ def _render_historical_context(summary: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _line_window(data: bytes, offset: int, before: int = 3, after: int = 3) -> bytes:
+    """Return the line containing ``offset`` plus up to ``before``/``after`` neighbouring lines."""
+    start = data.rfind(b"\n", 0, offset) + 1
+    for _ in range(before):
+        if start == 0:
+            break
+        start = data.rfind(b"\n", 0, start - 1) + 1
+    end = offset
+    for _ in range(after + 1):
+        newline = data.find(b"\n", end)
+        if newline < 0:
+            end = len(data)
+            break
+        end = newline + 1
+    return data[start:end]
+
+
 def _extract_log_highlights(raw_log_path: Path, matched_signatures: List[Dict[str, Any]], limit: int = 10) -> str:
     lines = ["## Key Log Highlights", ""]
     if not raw_log_path or not raw_log_path.exists():
         lines.append("Raw log not available for this session.")
         return "\n".join(lines)
 
-    log_text = raw_log_path.read_text(encoding="utf-8", errors="ignore")
-    log_lines = log_text.splitlines()
     if not matched_signatures:
         lines.append("No known QuickSet signatures were matched in the logs.")
         return "\n".join(lines)
 
+    # Searched as raw bytes; only the excerpts that make it into the report are decoded.
+    log_bytes = raw_log_path.read_bytes()
+
     for sig in matched_signatures[:limit]:
         sig_id = sig.get("id", "UNKNOWN")
         category = sig.get("category", "")
@@ -80,13 +100,13 @@ def _extract_log_highlights(raw_log_path: Path, matched_signatures: List[Dict[st
         lines.append(f"Pattern: `{pattern}`")
 
         excerpt = "Pattern not found in raw log."
-        for idx, line in enumerate(log_lines):
-            if pattern and pattern in line:
-                start = max(0, idx - 3)
-                end = min(len(log_lines), idx + 4)
-                snippet = "\n".join(log_lines[start:end])
-                excerpt = f"```text\n{snippet}\n```"
-                break
+        # Signatures are single-line, so a C-level find over the whole log
+        # replaces the per-line Python scan.
+        offset = log_bytes.find(pattern.encode("utf-8")) if pattern and "\n" not in pattern else -1
+        if offset >= 0:
+            window = _line_window(log_bytes, offset).decode("utf-8", errors="ignore")
+            snippet = "\n".join(window.splitlines())
+            excerpt = f"```text\n{snippet}\n```"
 
         lines.append("Excerpt:")
         lines.append(excerpt)
@@ -100,8 +120,11 @@ def generate_markdown_report(
     scenario_result: Dict[str, Any],
     report_path: Path,
     raw_log_path: Path | None = None,
+    steps: List[Dict[str, Any]] | None = None,
 ) -> None:
-    steps = _read_jsonl_steps(steps_jsonl_path)
+    # Callers that already parsed the steps JSONL pass it in to skip a second read.
+    if steps is None:
+        steps = _read_jsonl_steps(steps_jsonl_path)
     summary_lines = [
         f"# Scenario Report: {scenario_result.get('title', scenario_result.get('scenario_id', 'Unknown'))}",
         "",
@@ -127,12 +150,16 @@ def generate_markdown_report(
     tv_brand_ui = scenario_result.get("tv_brand_ui")
     tv_brand_logs = scenario_result.get("tv_brand_logs")
     tv_model_logs = scenario_result.get("tv_model_logs")
-    summary_lines.append("## TV Identity")
-    summary_lines.append("")
-    summary_lines.append(f"- Brand (UI): {tv_brand_ui or 'N/A'}")
-    summary_lines.append(f"- Brand (logs): {tv_brand_logs or 'N/A'}")
-    summary_lines.append(f"- Model (logs): {tv_model_logs or 'N/A'}")
-    summary_lines.append("")
+    summary_lines.extend(
+        (
+            "## TV Identity",
+            "",
+            f"- Brand (UI): {tv_brand_ui or 'N/A'}",
+            f"- Brand (logs): {tv_brand_logs or 'N/A'}",
+            f"- Model (logs): {tv_model_logs or 'N/A'}",
+            "",
+        )
+    )
 
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text("\n".join(summary_lines).strip() + "\n", encoding="utf-8")
+    report_path.write_bytes(("\n".join(summary_lines).strip() + "\n").encode("utf-8"))
@@ -3,7 +3,10 @@
 
 from __future__ import annotations
 
+import functools
+import sys
 import time
+from contextlib import ExitStack
 from importlib import import_module
 from pathlib import Path
 from typing import Any, Callable, Dict, Tuple, Optional
@@ -12,10 +15,38 @@ from src.adb.adb_client import ADBClient, ADBError
 from src.qa.step_logger import StepLogger
 
 
+_ADB_FAIL_TEMPLATE = (
+    "Unable to establish ADB connection to the STB at {target}.\n\n"
+    "Details:\n"
+    "{error_msg}\n\n"
+    "Possible causes:\n"
+    "- The STB is reachable by ping, but ADB over network is disabled.\n"
+    "- Developer Options → 'ADB over network' is OFF.\n"
+    "- Another tester/computer is already connected and blocking the session.\n"
+    "- A firewall or router is blocking TCP port 5555.\n"
+    "- The STB showed an ADB RSA authorization popup that wasn't approved.\n\n"
+    "Recommended actions:\n"
+    "1. On the STB: enable Developer Options → ADB over network.\n"
+    "2. Approve the RSA dialog (select 'Always allow').\n"
+    "3. On your machine: run 'adb kill-server' then 'adb start-server'.\n"
+    "4. If multiple machines/testers are connected: disconnect old sessions.\n\n"
+    "After fixing the issue, rerun the command:\n"
+    "python -m src.cli run --session-id {session_id} --stb-ip {target} --scenario {scenario}"
+)
+
+
 class ScenarioLoadError(RuntimeError):
     """Raised when the requested scenario cannot be imported or instantiated."""
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_scenario_cls(module_name: str, class_name: str) -> Optional[type]:
+    """Return the scenario class, or None if the module does not define it."""
+    # sys.modules hit skips the import machinery (and its lock) on the common path.
+    module = sys.modules.get(module_name) or import_module(module_name)
+    return getattr(module, class_name, None)
+
+
 class SessionRunner:
     """Runs a single scenario and returns structured results."""
 
@@ -77,8 +108,7 @@ class SessionRunner:
         except KeyError as exc:
             raise ScenarioLoadError(f"Scenario '{scenario_name}' is not registered.") from exc
 
-        module = import_module(module_name)
-        scenario_cls = getattr(module, class_name, None)
+        scenario_cls = _resolve_scenario_cls(module_name, class_name)
         if scenario_cls is None:
             raise ScenarioLoadError(
                 f"Scenario class '{class_name}' missing in module '{module_name}'."
@@ -120,32 +150,75 @@ class SessionRunner:
         if not error_msg:
             error_msg = "No additional error details reported by adb."
 
-        friendly_msg = (
-            f"Unable to establish ADB connection to the STB at {target}.\n\n"
-            f"Details:\n"
-            f"{error_msg}\n\n"
-            "Possible causes:\n"
-            "- The STB is reachable by ping, but ADB over network is disabled.\n"
-            "- Developer Options → 'ADB over network' is OFF.\n"
-            "- Another tester/computer is already connected and blocking the session.\n"
-            "- A firewall or router is blocking TCP port 5555.\n"
-            "- The STB showed an ADB RSA authorization popup that wasn't approved.\n\n"
-            "Recommended actions:\n"
-            "1. On the STB: enable Developer Options → ADB over network.\n"
-            "2. Approve the RSA dialog (select 'Always allow').\n"
-            "3. On your machine: run 'adb kill-server' then 'adb start-server'.\n"
-            "4. If multiple machines/testers are connected: disconnect old sessions.\n\n"
-            "After fixing the issue, rerun the command:\n"
-            f"python -m src.cli run --session-id {session_id} --stb-ip {target} --scenario {scenario.upper()}"
+        return _ADB_FAIL_TEMPLATE.format(
+            target=target,
+            error_msg=error_msg,
+            session_id=session_id,
+            scenario=scenario.upper(),
+        )
+
+    @staticmethod
+    def _failure_result(
+        scenario: str,
+        root_cause_category: str,
+        analysis: str,
+        **extra: Any,
+    ) -> Dict[str, Any]:
+        """Scenario result payload for runs that failed before producing their own."""
+        return {
+            "scenario_id": scenario.upper(),
+            "title": scenario.replace("_", " ").title(),
+            "status": "FAIL",
+            "root_cause_category": root_cause_category,
+            "analysis": analysis,
+            **extra,
+        }
+
+    def _adb_failure_result(
+        self,
+        exc: Exception,
+        *,
+        target: str,
+        session_id: str,
+        scenario: str,
+        logger: StepLogger,
+        raw_log_path: Path,
+        start_ts: float,
+    ) -> Dict[str, Any]:
+        """Log the ADB precheck failure and return the session result describing it."""
+        friendly_msg = self._build_friendly_adb_message(
+            target=target,
+            session_id=session_id,
+            scenario=scenario,
+            error_msg=str(exc),
         )
-        return friendly_msg
+        logger.log_step("adb_precheck", "FAIL", {"error": friendly_msg})
+        return {
+            "session_id": session_id,
+            "scenario": scenario,
+            "status": "FAIL",
+            "result": self._failure_result(
+                scenario,
+                "ADB_CONNECTION_FAILED",
+                friendly_msg,
+                auto_evidence={"error": friendly_msg},
+                tester_observations={},
+            ),
+            "session_log_path": logger.log_path,
+            "raw_log_path": raw_log_path,
+            "duration_seconds": time.time() - start_ts,
+        }
 
     # -------------------------------------------------------------------------
     # Public API
     # -------------------------------------------------------------------------
     def run(self, session_id: str, stb_ip: str, scenario_name: str) -> Dict[str, Any]:
         """Execute a scenario and return structured results without printing."""
-        normalized_scenario = self._normalize_scenario_name(scenario_name)
+        # Registry keys are already normalized, so an exact hit needs no string rework.
+        if scenario_name in self.SCENARIO_CLASS_MAP:
+            normalized_scenario = scenario_name
+        else:
+            normalized_scenario = self._normalize_scenario_name(scenario_name)
         logger = StepLogger(session_id, self.session_log_dir)
         adb = ADBClient(target=stb_ip)
         raw_log_path = self.raw_log_dir / f"{session_id}_{normalized_scenario}.log"
@@ -167,59 +240,17 @@ class SessionRunner:
                     "PASS",
                     {"message": "ADB connection established.", "target": adb.target},
                 )
-            except ADBError as exc:
-                friendly_msg = self._build_friendly_adb_message(
-                    target=getattr(adb, "target", stb_ip),
-                    session_id=session_id,
-                    scenario=normalized_scenario,
-                    error_msg=str(exc),
-                )
-                logger.log_step("adb_precheck", "FAIL", {"error": friendly_msg})
-
-                return {
-                    "session_id": session_id,
-                    "scenario": normalized_scenario,
-                    "status": "FAIL",
-                    "result": {
-                        "scenario_id": normalized_scenario.upper(),
-                        "title": normalized_scenario.replace("_", " ").title(),
-                        "status": "FAIL",
-                        "root_cause_category": "ADB_CONNECTION_FAILED",
-                        "analysis": friendly_msg,
-                        "auto_evidence": {"error": friendly_msg},
-                        "tester_observations": {},
-                    },
-                    "session_log_path": logger.log_path,
-                    "raw_log_path": raw_log_path,
-                    "duration_seconds": time.time() - start_ts,
-                }
             except Exception as exc:  # noqa: BLE001
-                # Catch any unexpected exception and surface it as a friendly ADB failure.
-                friendly_msg = self._build_friendly_adb_message(
+                # ADBError and any unexpected exception are both surfaced as a friendly ADB failure.
+                return self._adb_failure_result(
+                    exc,
                     target=getattr(adb, "target", stb_ip),
                     session_id=session_id,
                     scenario=normalized_scenario,
-                    error_msg=str(exc),
+                    logger=logger,
+                    raw_log_path=raw_log_path,
+                    start_ts=start_ts,
                 )
-                logger.log_step("adb_precheck", "FAIL", {"error": friendly_msg})
-
-                return {
-                    "session_id": session_id,
-                    "scenario": normalized_scenario,
-                    "status": "FAIL",
-                    "result": {
-                        "scenario_id": normalized_scenario.upper(),
-                        "title": normalized_scenario.replace("_", " ").title(),
-                        "status": "FAIL",
-                        "root_cause_category": "ADB_CONNECTION_FAILED",
-                        "analysis": friendly_msg,
-                        "auto_evidence": {"error": friendly_msg},
-                        "tester_observations": {},
-                    },
-                    "session_log_path": logger.log_path,
-                    "raw_log_path": raw_log_path,
-                    "duration_seconds": time.time() - start_ts,
-                }
 
             # -----------------------------------------------------------------
             # 2) Build scenario instance
@@ -237,13 +268,9 @@ class SessionRunner:
                     "session_id": session_id,
                     "scenario": normalized_scenario,
                     "status": "FAIL",
-                    "result": {
-                        "scenario_id": normalized_scenario.upper(),
-                        "title": normalized_scenario.replace("_", " ").title(),
-                        "status": "FAIL",
-                        "root_cause_category": "SCENARIO_LOAD_FAILED",
-                        "analysis": str(exc),
-                    },
+                    "result": self._failure_result(
+                        normalized_scenario, "SCENARIO_LOAD_FAILED", str(exc)
+                    ),
                     "session_log_path": logger.log_path,
                     "raw_log_path": raw_log_path,
                     "duration_seconds": time.time() - start_ts,
@@ -251,58 +278,49 @@ class SessionRunner:
 
             # tv_auto_sync scenario manages logcat on its own
             scenario_manages_logcat = normalized_scenario == "tv_auto_sync"
-            logcat_proc: Optional[Any] = None
 
             # -----------------------------------------------------------------
-            # 3) Start logcat capture for scenarios that don't manage it internally
+            # 3) Capture logcat for scenarios that don't manage it internally;
+            #    the capture is stopped and reaped when the block exits.
             # -----------------------------------------------------------------
-            if not scenario_manages_logcat:
+            with ExitStack() as logcat_scope:
+                if not scenario_manages_logcat:
+                    try:
+                        logcat_scope.enter_context(adb.logcat_capture(raw_log_path))
+                        logger.log_step(
+                            "logcat_capture_start",
+                            "INFO",
+                            {"path": str(raw_log_path)},
+                        )
+                    except ADBError as exc:
+                        logger.log_step("logcat_capture_start", "FAIL", {"error": str(exc)})
+
+                # -----------------------------------------------------------------
+                # 4) Run scenario
+                # -----------------------------------------------------------------
+                logger.log_step(
+                    "session_start",
+                    "INFO",
+                    {"scenario": normalized_scenario, "stb_ip": stb_ip},
+                )
+
                 try:
-                    logcat_proc = adb.start_logcat_capture(raw_log_path)
-                    logger.log_step(
-                        "logcat_capture_start",
-                        "INFO",
-                        {"path": str(raw_log_path)},
+                    if normalized_scenario == "tv_auto_sync":
+                        question_cb = self._build_question_callback()
+                        scenario_result = scenario.run(question_cb)
+                    else:
+                        scenario_result = scenario.run()
+                except Exception as exc:  # noqa: BLE001
+                    scenario_result = self._failure_result(
+                        normalized_scenario, "EXCEPTION", str(exc)
                     )
-                except ADBError as exc:
-                    logger.log_step("logcat_capture_start", "FAIL", {"error": str(exc)})
+                    logger.log_step("scenario_exception", "FAIL", {"error": str(exc)})
 
-            # -----------------------------------------------------------------
-            # 4) Run scenario
-            # -----------------------------------------------------------------
-            logger.log_step(
-                "session_start",
-                "INFO",
-                {"scenario": normalized_scenario, "stb_ip": stb_ip},
-            )
-
-            try:
-                if normalized_scenario == "tv_auto_sync":
-                    question_cb = self._build_question_callback()
-                    scenario_result = scenario.run(question_cb)
-                else:
-                    scenario_result = scenario.run()
-            except Exception as exc:  # noqa: BLE001
-                scenario_result = {
-                    "scenario_id": normalized_scenario.upper(),
-                    "title": normalized_scenario.replace("_", " ").title(),
-                    "status": "FAIL",
-                    "root_cause_category": "EXCEPTION",
-                    "analysis": str(exc),
-                }
-                logger.log_step("scenario_exception", "FAIL", {"error": str(exc)})
-
-            status = scenario_result.get("status", "UNKNOWN")
-            logger.log_step("session_end", status, {"scenario": normalized_scenario})
-
-            # -----------------------------------------------------------------
-            # 5) Stop logcat capture if we started it
-            # -----------------------------------------------------------------
-            if not scenario_manages_logcat and logcat_proc is not None and logcat_proc.poll() is None:
-                logcat_proc.terminate()
+                status = scenario_result.get("status", "UNKNOWN")
+                logger.log_step("session_end", status, {"scenario": normalized_scenario})
 
             # -----------------------------------------------------------------
-            # 6) Return structured session result
+            # 5) Return structured session result
             # -----------------------------------------------------------------
             return {
                 "session_id": session_id,
@@ -314,4 +332,5 @@ class SessionRunner:
                 "duration_seconds": time.time() - start_ts,
             }
         finally:
+            adb.close_shell_session()
             logger.close()
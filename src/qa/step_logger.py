@@ -1,10 +1,26 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:  # orjson serializes straight to UTF-8 bytes when installed
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+if orjson is not None:
+
+    def _encode_record(record: Dict[str, Any]) -> bytes:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+
+else:  # pragma: no cover - stdlib fallback
+
+    def _encode_record(record: Dict[str, Any]) -> bytes:
+        return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
 
 class StepLogger:
     """
@@ -16,7 +32,10 @@ class StepLogger:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self._log_path = self.output_dir / f"{self.session_id}.jsonl"
-        self._fh = self._log_path.open("a", encoding="utf-8")
+        # Steps arrive many per second; the formatted timestamp is reused within a second.
+        self._ts_second = -1
+        self._ts_text = ""
+        self._fh = self._log_path.open("ab")
 
     @property
     def log_path(self) -> Path:
@@ -40,14 +59,20 @@ class StepLogger:
         :param status: PASS / FAIL / INFO / ERROR / WARNING.
         :param details: Optional extra data (dict).
         """
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts_text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
         record = {
-            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "timestamp": self._ts_text,
             "session_id": self.session_id,
             "step_name": step_name,
             "status": status,
             "details": details or {},
         }
-        self._fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        # Flushed per step: the backend reads this file while the session is still
+        # running (timeline endpoints, the finalized session's adb log).
+        self._fh.write(_encode_record(record))
         self._fh.flush()
 
     def close(self) -> None:
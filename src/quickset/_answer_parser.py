@@ -0,0 +1,22 @@
+"""Shared parsing of tester yes/no answers (English and Hebrew)."""
+
+from __future__ import annotations
+
+from typing import AbstractSet, Optional
+
+YES_ANSWERS = frozenset({"yes", "y", "true", "t", "1", "כן"})
+NO_ANSWERS = frozenset({"no", "n", "false", "f", "0", "לא"})
+
+
+def parse_yes_no(
+    raw: str,
+    yes_values: AbstractSet[str] = YES_ANSWERS,
+    no_values: AbstractSet[str] = NO_ANSWERS,
+) -> Optional[bool]:
+    """Return True/False for a recognised answer, None for anything else."""
+    normalized = raw.strip().casefold()
+    if normalized in yes_values:
+        return True
+    if normalized in no_values:
+        return False
+    return None
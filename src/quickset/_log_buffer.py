@@ -0,0 +1,63 @@
+"""Shared read-only view of a captured log file, so analyzers can reuse one mapping."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Union
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+@contextmanager
+def open_log_buffer(log_path: Path) -> Iterator[Optional[Buffer]]:
+    """
+    Map log_path read-only for the duration of the block.
+
+    Yields None when the file does not exist and b"" when it is empty (mmap rejects
+    zero-length files); otherwise an mmap whose pages are read lazily.
+    """
+    try:
+        f = log_path.open("rb")
+    except FileNotFoundError:
+        yield None
+        return
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log_map:
+            yield log_map
+
+
+def present_needles(buffer: Buffer, needles: Sequence[bytes]) -> Set[int]:
+    """
+    Return the indices of the needles that occur anywhere in buffer.
+
+    Needles sharing a first byte are searched together as one literal-prefixed
+    alternation, which lets the regex engine skip ahead to that byte instead of
+    running one full find() per needle. After each hit the alternation is narrowed
+    to the needles still missing, so a frequent needle costs one hit, not thousands.
+    """
+    groups: Dict[bytes, List[int]] = {}
+    for index, needle in enumerate(needles):
+        if needle:
+            groups.setdefault(needle[:1], []).append(index)
+
+    found: Set[int] = set()
+    for first, pending in groups.items():
+        pos = 0
+        while pending:
+            alternation = b"|".join(re.escape(needles[i][1:]) for i in pending)
+            match = re.compile(re.escape(first) + b"(?:" + alternation + b")").search(buffer, pos)
+            if match is None:
+                break
+            pos = match.start()
+            hits = [i for i in pending if buffer[pos : pos + len(needles[i])] == needles[i]]
+            found.update(hits)
+            pending = [i for i in pending if i not in hits]
+            pos += 1
+    return found
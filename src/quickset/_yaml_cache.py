@@ -0,0 +1,81 @@
+"""
+Knowledge YAML loading: LibYAML-backed safe_load, a per-file parse cache, and a
+pickled on-disk copy of each parse so a fresh process skips the YAML parser.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+try:  # libyaml C bindings when available
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as YamlSafeLoader
+
+
+def safe_load(text: str) -> Any:
+    """yaml.safe_load, using the LibYAML parser when PyYAML was built with it."""
+    return yaml.load(text, Loader=YamlSafeLoader)
+
+
+def _pickle_dir() -> Optional[Path]:
+    """Per-user cache directory, or None if it cannot be trusted or created."""
+    getuid = getattr(os, "getuid", None)  # POSIX only; Windows temp dirs are per-user
+    name = "qa_quickset_yaml" if getuid is None else f"qa_quickset_yaml_{getuid()}"
+    path = Path(tempfile.gettempdir()) / name
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        st = path.lstat()
+    except OSError:
+        return None
+    # Pickles are only read from a private directory we own: never from one another
+    # user could have planted files in.
+    if getuid is not None and (st.st_uid != getuid() or st.st_mode & 0o077 or path.is_symlink()):
+        return None
+    return path
+
+
+def _pickle_path(path_str: str, mtime_ns: int, size: int) -> Optional[Path]:
+    cache_dir = _pickle_dir()
+    if cache_dir is None:
+        return None
+    key = hashlib.blake2b(f"{path_str}\0{mtime_ns}\0{size}".encode(), digest_size=16).hexdigest()
+    return cache_dir / f"{Path(path_str).name}.{key}.pkl"
+
+
+@functools.lru_cache(maxsize=128)
+def _parse(path_str: str, mtime_ns: int, size: int) -> Any:
+    # mtime_ns/size are only part of the cache key: an edited file gets a new entry.
+    pickled = _pickle_path(path_str, mtime_ns, size)
+    if pickled is not None:
+        try:
+            return pickle.loads(pickled.read_bytes())
+        except Exception:  # noqa: BLE001 - missing or unreadable copy: parse the YAML
+            pass
+    data = safe_load(Path(path_str).read_text(encoding="utf-8")) or {}
+    if pickled is not None:
+        try:
+            with tempfile.NamedTemporaryFile(dir=pickled.parent, delete=False) as tmp:
+                tmp.write(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp.name, pickled)
+        except OSError:
+            pass
+    return data
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """
+    Parse a YAML file once per (mtime, size) and return the cached result.
+
+    The returned object is shared between callers; treat it as read-only.
+    """
+    stat = path.stat()
+    return _parse(str(path), stat.st_mtime_ns, stat.st_size)
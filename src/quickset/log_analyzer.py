@@ -1,15 +1,25 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set
 
+from src.quickset._log_buffer import Buffer, open_log_buffer
 
-def analyze_quickset_logs(log_path: Path, logs_cfg: Dict[str, Any]) -> Dict[str, Any]:
+_READ_CHUNK = 1 << 20
+
+
+def analyze_quickset_logs(
+    log_path: Path,
+    logs_cfg: Dict[str, Any],
+    log_buffer: Optional[Buffer] = None,
+) -> Dict[str, Any]:
     """
     Analyze QuickSet-related logcat output for TV_AUTO_SYNC.
 
     :param log_path: Path to the captured logcat text file.
     :param logs_cfg: "logs" section from the scenario knowledge (required_tags, success_patterns, failure_patterns).
+    :param log_buffer: Contents of log_path already mapped by the caller (see open_log_buffer);
+        when omitted the file is mapped here.
     :return: Dict with basic analysis: matched patterns, status, etc.
     """
     if not log_path.exists():
@@ -22,23 +32,50 @@ def analyze_quickset_logs(log_path: Path, logs_cfg: Dict[str, Any]) -> Dict[str,
             "lines_checked": 0,
         }
 
+    if log_buffer is None:
+        with open_log_buffer(log_path) as mapped:
+            return analyze_quickset_logs(log_path, logs_cfg, b"" if mapped is None else mapped)
+
     required_tags: List[str] = list(logs_cfg.get("required_tags", []))
     success_patterns: List[str] = list(logs_cfg.get("success_patterns", []))
     failure_patterns: List[str] = list(logs_cfg.get("failure_patterns", []))
 
-    with log_path.open("r", encoding="utf-8", errors="ignore") as f:
-        lines = f.readlines()
-
-    lines_lower = [line.lower() for line in lines]
-
-    def any_in_lines(pattern: str) -> bool:
-        p = pattern.lower()
-        return any(p in line for line in lines_lower)
+    # Lowercase every pattern once up front; a pattern listed in several groups is
+    # only searched for once per block. The log is scanned as raw bytes in fixed-size
+    # blocks (ASCII lower(), no UTF-8 decode, no per-line Python loop), so patterns
+    # are lowered as str and then encoded.
+    success_lc = [p.lower().encode("utf-8") for p in success_patterns]
+    failure_lc = [p.lower().encode("utf-8") for p in failure_patterns]
+    tags_lc = [t.lower().encode("utf-8") for t in required_tags]
+    pending = {*success_lc, *failure_lc, *tags_lc}
+    found: Set[bytes] = set()
+    # Patterns longer than one byte may straddle a read boundary; carry that much of
+    # the previous block into the next search window.
+    overlap = max(max(map(len, pending), default=0) - 1, 0)
+    tail = b""
+    # lines_checked keeps text-mode semantics: \r\n, \r and \n each end a line.
+    line_breaks = 0
+    last = b""
+    for start in range(0, len(log_buffer), _READ_CHUNK):
+        block = log_buffer[start : start + _READ_CHUNK]
+        line_breaks += block.count(b"\n") + block.count(b"\r") - block.count(b"\r\n")
+        if last == b"\r" and block[:1] == b"\n":
+            line_breaks -= 1
+        last = block[-1:]
+        if not pending:
+            continue
+        window = tail + block.lower()
+        hits = {p for p in pending if p in window}
+        if hits:
+            found |= hits
+            pending -= hits
+        tail = window[-overlap:] if overlap else b""
+    lines_checked = line_breaks + (last not in (b"", b"\r", b"\n"))
 
-    matched_success = [p for p in success_patterns if any_in_lines(p)]
-    matched_failure = [p for p in failure_patterns if any_in_lines(p)]
+    matched_success = [p for p, lc in zip(success_patterns, success_lc) if lc in found]
+    matched_failure = [p for p, lc in zip(failure_patterns, failure_lc) if lc in found]
 
-    has_required_tags = all(any_in_lines(tag) for tag in required_tags) if required_tags else True
+    has_required_tags = found.issuperset(tags_lc)
 
     if matched_failure:
         status = "failure"
@@ -53,5 +90,5 @@ def analyze_quickset_logs(log_path: Path, logs_cfg: Dict[str, Any]) -> Dict[str,
         "matched_success_patterns": matched_success,
         "matched_failure_patterns": matched_failure,
         "has_required_tags": has_required_tags,
-        "lines_checked": len(lines),
+        "lines_checked": lines_checked,
     }
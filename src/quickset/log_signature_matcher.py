@@ -1,39 +1,70 @@
 from __future__ import annotations
 
-import json
+import functools
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 
-import yaml
+from src.quickset._log_buffer import Buffer, open_log_buffer, present_needles
+from src.quickset._yaml_cache import safe_load
 
+SIGNATURES_DIR = Path(__file__).resolve().parents[2] / "knowledge" / "signatures"
 
-def load_signatures() -> List[Dict[str, Any]]:
-    base = Path(__file__).resolve().parents[2] / "knowledge" / "signatures"
-    success_path = base / "autosync_success.yaml"
-    failure_path = base / "autosync_failure.yaml"
+
+@functools.lru_cache(maxsize=None)
+def load_signatures() -> Tuple[Dict[str, Any], ...]:
+    """Load the autosync signature files once; the result is shared, do not mutate."""
+    success_path = SIGNATURES_DIR / "autosync_success.yaml"
+    failure_path = SIGNATURES_DIR / "autosync_failure.yaml"
     signatures: List[Dict[str, Any]] = []
     for path in (success_path, failure_path):
         if path.exists():
-            data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+            data = safe_load(path.read_text(encoding="utf-8")) or {}
             signatures.extend(data.get("signatures", []))
-    return signatures
+    return tuple(signatures)
+
+
+@functools.lru_cache(maxsize=None)
+def _signature_needles() -> Tuple[Tuple[Dict[str, Any], str, bytes], ...]:
+    """(signature, pattern, encoded pattern) for every signature with a pattern."""
+    return tuple(
+        (sig, sig["pattern"], sig["pattern"].encode("utf-8"))
+        for sig in load_signatures()
+        if sig.get("pattern")
+    )
+
+
+def match_signatures(log_path: Path, log_buffer: Optional[Buffer] = None) -> List[Dict[str, Any]]:
+    """
+    Return list of matched signature dicts (id, category, severity, pattern).
+
+    log_buffer is the already-mapped contents of log_path (see open_log_buffer);
+    when omitted the file is mapped here.
+    """
+    signatures = _signature_needles()
+    if not signatures or not log_path.exists():
+        return []
+    if log_buffer is None:
+        with open_log_buffer(log_path) as mapped:
+            return _match_in_buffer(signatures, b"" if mapped is None else mapped)
+    return _match_in_buffer(signatures, log_buffer)
 
 
-def match_signatures(log_path: Path) -> List[Dict[str, Any]]:
-    """Return list of matched signature dicts (id, category, severity, pattern)."""
-    signatures = load_signatures()
-    log_text = log_path.read_text(encoding="utf-8", errors="ignore") if log_path.exists() else ""
+def _match_in_buffer(
+    signatures: Tuple[Tuple[Dict[str, Any], str, bytes], ...], log_buffer: Buffer
+) -> List[Dict[str, Any]]:
+    # Searched in place through the page cache: no copy of the log in memory,
+    # and no UTF-8 decode pass over it.
+    present = present_needles(log_buffer, [needle for _, _, needle in signatures])
     matches: List[Dict[str, Any]] = []
-    for sig in signatures:
-        pattern = sig.get("pattern", "")
-        if pattern and pattern in log_text:
+    for index, (sig, pattern, _) in enumerate(signatures):
+        if index in present:
             matches.append(
                 {
                     "id": sig.get("id"),
                     "category": sig.get("category"),
                     "severity": sig.get("severity"),
                     "pattern": pattern,
-                    "tags": sig.get("tags", []),
+                    "tags": list(sig.get("tags", [])),
                 }
             )
     return matches
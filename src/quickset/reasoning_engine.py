@@ -1,78 +1,90 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Sequence, Tuple
 
-import yaml
+from src.quickset._yaml_cache import safe_load
+
+KNOWLEDGE_DIR = Path(__file__).resolve().parents[2] / "knowledge"
 
 
 def load_yaml(path: Path) -> Dict[str, Any]:
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return safe_load(path.read_text(encoding="utf-8")) or {}
 
 
-def load_errors() -> Dict[str, Dict[str, Any]]:
-    path = Path(__file__).resolve().parents[2] / "knowledge" / "core" / "quickset_errors.yaml"
-    data = load_yaml(path)
-    return {item["id"]: item for item in data.get("errors", [])}
+# The knowledge files are static for the life of the process, so each is parsed
+# once; top-level containers are read-only so callers cannot corrupt the cache.
+@functools.lru_cache(maxsize=None)
+def load_errors() -> Mapping[str, Dict[str, Any]]:
+    data = load_yaml(KNOWLEDGE_DIR / "core" / "quickset_errors.yaml")
+    return MappingProxyType({item["id"]: item for item in data.get("errors", [])})
 
 
-def load_rules() -> List[Dict[str, Any]]:
-    path = Path(__file__).resolve().parents[2] / "knowledge" / "rules" / "autosync_rules.yaml"
-    data = load_yaml(path)
-    return data.get("rules", [])
+@functools.lru_cache(maxsize=None)
+def load_rules() -> Tuple[Dict[str, Any], ...]:
+    data = load_yaml(KNOWLEDGE_DIR / "rules" / "autosync_rules.yaml")
+    return tuple(data.get("rules", []))
 
 
-def load_scenario_meta() -> Dict[str, Any]:
-    path = Path(__file__).resolve().parents[2] / "knowledge" / "scenarios" / "tv_auto_sync.yaml"
-    return load_yaml(path)
+@functools.lru_cache(maxsize=None)
+def load_scenario_meta() -> Mapping[str, Any]:
+    return MappingProxyType(load_yaml(KNOWLEDGE_DIR / "scenarios" / "tv_auto_sync.yaml"))
 
 
-def evaluate_rules(
-    rules: List[Dict[str, Any]],
+# Rule conditions flattened once: (required signal ids, tester equals, tester
+# one-of, probe equals, outcome). Matching then never re-reads the rule dicts.
+CompiledRule = Tuple[
+    FrozenSet[Any],
+    Tuple[Tuple[str, Any], ...],
+    Tuple[Tuple[str, Any], ...],
+    Tuple[Tuple[str, Any], ...],
+    Dict[str, Any],
+]
+
+
+def compile_rules(rules: Sequence[Dict[str, Any]]) -> Tuple[CompiledRule, ...]:
+    compiled: List[CompiledRule] = []
+    for rule in rules:
+        conditions = rule.get("conditions", {})
+        compiled.append(
+            (
+                frozenset(conditions.get("required_signals", []) or []),
+                tuple((conditions.get("tester", {}) or {}).items()),
+                tuple((conditions.get("tester_any", {}) or {}).items()),
+                tuple((conditions.get("probe", {}) or {}).items()),
+                rule.get("outcome", {}),
+            )
+        )
+    return tuple(compiled)
+
+
+@functools.lru_cache(maxsize=None)
+def load_compiled_rules() -> Tuple[CompiledRule, ...]:
+    return compile_rules(load_rules())
+
+
+def _first_matching_outcome(
+    compiled_rules: Sequence[CompiledRule],
     matched_signatures: List[Dict[str, Any]],
     tester_observations: Dict[str, Any],
     volume_probe: Dict[str, Any] | None,
 ) -> Dict[str, Any]:
     matched_ids = {m.get("id") for m in matched_signatures}
-    for rule in rules:
-        conditions = rule.get("conditions", {})
-        required = set(conditions.get("required_signals", []) or [])
-        tester_require = conditions.get("tester", {}) or {}
-        tester_any = conditions.get("tester_any", {}) or {}
-        probe_require = conditions.get("probe", {}) or {}
-
-        if required and not required.issubset(matched_ids):
+    observed = tester_observations.get
+    for required, tester, tester_any, probe, outcome in compiled_rules:
+        if required and not required <= matched_ids:
             continue
-
-        tester_ok = True
-        for key, expected in tester_require.items():
-            if tester_observations.get(key) != expected:
-                tester_ok = False
-                break
-        if not tester_ok:
+        if any(observed(key) != expected for key, expected in tester):
             continue
-
-        any_ok = True
-        for key, expected_values in tester_any.items():
-            if tester_observations.get(key) not in expected_values:
-                any_ok = False
-                break
-        if not any_ok:
+        if any(observed(key) not in expected_values for key, expected_values in tester_any):
             continue
-
-        probe_ok = True
-        if probe_require:
-            if not volume_probe:
-                probe_ok = False
-            else:
-                for key, expected in probe_require.items():
-                    if volume_probe.get(key) != expected:
-                        probe_ok = False
-                        break
-        if not probe_ok:
+        if probe and (
+            not volume_probe or any(volume_probe.get(key) != expected for key, expected in probe)
+        ):
             continue
-
-        return rule.get("outcome", {})
+        return outcome
 
     return {
         "status": "INCONCLUSIVE",
@@ -81,6 +93,17 @@ def evaluate_rules(
     }
 
 
+def evaluate_rules(
+    rules: Sequence[Dict[str, Any]],
+    matched_signatures: List[Dict[str, Any]],
+    tester_observations: Dict[str, Any],
+    volume_probe: Dict[str, Any] | None,
+) -> Dict[str, Any]:
+    return _first_matching_outcome(
+        compile_rules(rules), matched_signatures, tester_observations, volume_probe
+    )
+
+
 def reason_autosync(
     matched_signatures: List[Dict[str, Any]],
     tester_observations: Dict[str, Any],
@@ -91,7 +114,7 @@ def reason_autosync(
     state_after: Dict[str, Any] | None = None,
     state_diff: Dict[str, Any] | None = None,
 ) -> Dict[str, Any]:
-    rules = load_rules()
+    compiled_rules = load_compiled_rules()
     errors = load_errors()
     scenario_meta = load_scenario_meta()
 
@@ -101,7 +124,9 @@ def reason_autosync(
     state_after = state_after or {}
     state_diff = state_diff or {}
 
-    outcome = evaluate_rules(rules, matched_signatures, tester_observations, volume_probe)
+    outcome = _first_matching_outcome(
+        compiled_rules, matched_signatures, tester_observations, volume_probe
+    )
     status = outcome.get("status", "INCONCLUSIVE")
     root_cause_category = outcome.get("root_cause_category", "INCONCLUSIVE")
     analysis = outcome.get("analysis", "")
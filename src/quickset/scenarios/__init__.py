@@ -2,23 +2,55 @@
 
 from __future__ import annotations
 
+import functools
+import os
 from importlib import import_module
-from pkgutil import iter_modules
 from pathlib import Path
-from typing import List
+from typing import Any, List, Tuple
 
 PACKAGE_PATH = Path(__file__).parent
 
+# Scenario classes are exposed on the package lazily (PEP 562): the owning
+# submodule is only imported when its class is first accessed.
+_SCENARIO_CLASSES = {
+    "BatteryStatusScenario": "battery_status",
+    "LiveButtonMappingScenario": "live_button_mapping",
+    "RemotePairUnpairScenario": "remote_pair_unpair",
+    "TvAutoSyncScenario": "tv_auto_sync",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_scenario_modules() -> Tuple[str, ...]:
+    # One getdents pass; DirEntry.is_file() uses the d_type it returns instead of a stat.
+    with os.scandir(PACKAGE_PATH) as entries:
+        return tuple(
+            sorted(
+                entry.name[:-3]
+                for entry in entries
+                if entry.name.endswith(".py") and not entry.name.startswith("_") and entry.is_file()
+            )
+        )
+
 
 def available_scenarios() -> List[str]:
     """Return the list of available scenario module names."""
-    return [
-        module.name
-        for module in iter_modules([str(PACKAGE_PATH)])
-        if not module.ispkg and not module.name.startswith("_")
-    ]
+    return list(_scan_scenario_modules())
 
 
 def load_scenario_module(name: str):
     """Import and return a scenario module by name."""
     return import_module(f"{__name__}.{name}")
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _SCENARIO_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(load_scenario_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_SCENARIO_CLASSES})
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any, Dict
 
 from src.adb.adb_client import ADBClient, ADBError
 from src.qa.step_logger import StepLogger
 
+# First line of 'dumpsys battery' output mentioning the level, in any case.
+_LEVEL_RE = re.compile(r"^.*level.*$", re.IGNORECASE | re.MULTILINE)
+
 
 class BatteryStatusScenario:
     """Pull the current battery status from QuickSet and validate thresholds."""
@@ -34,13 +38,11 @@ class BatteryStatusScenario:
             self.logger.log_step("query_battery", "FAIL", {"error": str(exc)})
             return {"status": "FAIL", "details": {"error": str(exc)}}
 
-        level_line = next(
-            (line for line in status_output.splitlines() if "level" in line.lower()),
-            "",
-        )
-        if level_line:
-            self.logger.log_step("battery_level_detected", "PASS", {"line": level_line.strip()})
-            return {"status": "PASS", "details": {"battery_info": level_line.strip()}}
+        match = _LEVEL_RE.search(status_output)
+        if match:
+            level_line = match.group(0).strip()
+            self.logger.log_step("battery_level_detected", "PASS", {"line": level_line})
+            return {"status": "PASS", "details": {"battery_info": level_line}}
 
         self.logger.log_step("battery_level_missing", "FAIL", {"output": status_output})
         return {"status": "FAIL", "details": {"message": "Battery data missing from output."}}
@@ -4,11 +4,12 @@ from pathlib import Path
 from typing import Any, Callable, Dict
 
 from src.qa.step_logger import StepLogger
+from src.quickset._answer_parser import parse_yes_no
 
 QuestionCallback = Callable[[str, str], str]
 
-YES_VALUES = {"yes", "y", "true", "1", "כן"}
-NO_VALUES = {"no", "n", "false", "0", "לא"}
+YES_VALUES = frozenset({"yes", "y", "true", "1", "כן"})
+NO_VALUES = frozenset({"no", "n", "false", "0", "לא"})
 
 
 class LiveButtonMappingScenario:
@@ -38,12 +39,7 @@ class LiveButtonMappingScenario:
     def _normalize_bool(self, value: str) -> bool | None:
         if not value:
             return None
-        normalized = value.strip().lower()
-        if normalized in YES_VALUES:
-            return True
-        if normalized in NO_VALUES:
-            return False
-        return None
+        return parse_yes_no(value, YES_VALUES, NO_VALUES)
 
     def run(self, ask: QuestionCallback) -> Dict[str, Any]:
         observations: Dict[str, Any] = {}
@@ -1,12 +1,14 @@
 # File: src/quickset/scenarios/tv_auto_sync.py
 from __future__ import annotations
 
+import json
 from pathlib import Path
-from typing import Any, Callable, Dict
-
-import yaml  # make sure PyYAML is in requirements.txt
+from typing import Any, Callable, Dict, List
 
 from src.qa.step_logger import StepLogger
+from src.quickset._answer_parser import parse_yes_no
+from src.quickset._log_buffer import open_log_buffer
+from src.quickset._yaml_cache import load_yaml_cached
 from src.quickset.log_analyzer import analyze_quickset_logs
 from src.quickset.log_signature_matcher import match_signatures
 from src.quickset.reasoning_engine import reason_autosync
@@ -43,8 +45,7 @@ class TvAutoSyncScenario:
     def _load_knowledge(self) -> Dict[str, Any]:
         if not self.knowledge_path.exists():
             raise FileNotFoundError(f"Knowledge file not found: {self.knowledge_path}")
-        with self.knowledge_path.open("r", encoding="utf-8") as fh:
-            return yaml.safe_load(fh.read()) or {}
+        return load_yaml_cached(self.knowledge_path)
 
     def _ask_tester_questions(self, ask: QuestionCallback) -> Dict[str, Any]:
         observations: Dict[str, Any] = {}
@@ -55,19 +56,30 @@ class TvAutoSyncScenario:
             if not q_id or not q_text:
                 continue
             raw_answer = ask(q_id, q_text).strip()
+            value: Any = raw_answer
             if q_type == "yes_no":
-                normalized = raw_answer.lower()
-                if normalized in ("yes", "y", "true", "t", "1", "כן"):
-                    value: Any = True
-                elif normalized in ("no", "n", "false", "f", "0", "לא"):
-                    value = False
-                else:
-                    value = raw_answer
-            else:
-                value = raw_answer
+                parsed = parse_yes_no(raw_answer)
+                if parsed is not None:
+                    value = parsed
             observations[q_id] = value
         return observations
 
+    def _write_analysis_artifact(
+        self,
+        log_result: Dict[str, Any],
+        matched_signatures: List[Dict[str, Any]],
+        state_eval: Dict[str, Any],
+    ) -> Path | None:
+        """Store the full log analysis beside the raw log; the step log only gets a summary."""
+        path = self.raw_log_dir / f"{self.session_id}_analysis.json"
+        payload = {"log_result": log_result, "matched_signatures": matched_signatures, "state": state_eval}
+        try:
+            with path.open("w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2, ensure_ascii=False)
+        except OSError:
+            return None
+        return path
+
     def run(self, ask: QuestionCallback) -> Dict[str, Any]:
         scenario_id = self.knowledge.get("scenario_id", "TV_AUTO_SYNC")
         title = self.knowledge.get("title", "TV Auto Sync")
@@ -127,20 +139,30 @@ class TvAutoSyncScenario:
         self.step_logger.log_step("tester_questions", "PASS", {"observations": tester_observations})
 
         self.step_logger.log_step("log_analysis_start", "INFO", {"log_path": str(log_path)})
-        log_result = analyze_quickset_logs(log_path, self._logs_cfg)
-        matched_signatures = match_signatures(log_path)
-        state_eval = evaluate_states(matched_signatures)
-        self.step_logger.log_step(
-            "log_analysis_complete",
-            "PASS",
-            {"log_result": log_result, "matched_signatures": matched_signatures, "state": state_eval},
-        )
-
-        tv_meta = extract_tv_metadata_from_log(log_path)
-        self.step_logger.log_step("tv_metadata", "INFO", tv_meta)
-
-        probe = VolumeBehaviorProbe(self.adb_client, log_path, self.knowledge_root)
-        volume_probe = probe.run_probe(self.step_logger, ask)
+        # Map the capture once and hand the same buffer to every analysis stage.
+        with open_log_buffer(log_path) as log_buffer:
+            log_result = analyze_quickset_logs(log_path, self._logs_cfg, log_buffer)
+            matched_signatures = match_signatures(log_path, log_buffer)
+            state_eval = evaluate_states(matched_signatures)
+            analysis_path = self._write_analysis_artifact(log_result, matched_signatures, state_eval)
+            self.step_logger.log_step(
+                "log_analysis_complete",
+                "PASS",
+                {
+                    "log_status": log_result.get("status"),
+                    "matches": len(matched_signatures),
+                    "first_category": matched_signatures[0].get("category") if matched_signatures else None,
+                    # compute_session_decision reads the terminal/matched ids from "state".
+                    "state": state_eval,
+                    "analysis_path": str(analysis_path) if analysis_path else None,
+                },
+            )
+
+            tv_meta = extract_tv_metadata_from_log(log_path, log_buffer)
+            self.step_logger.log_step("tv_metadata", "INFO", tv_meta)
+
+            probe = VolumeBehaviorProbe(self.adb_client, log_path, self.knowledge_root, log_buffer)
+            volume_probe = probe.run_probe(self.step_logger, ask)
         if volume_probe.get("volume_source") == "TV":
             tester_observations["tv_volume_changed"] = True
             tester_observations["tv_osd_seen"] = True
@@ -3,12 +3,15 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict, List, Any
 
-import yaml
+from src.quickset._yaml_cache import load_yaml_cached
+
+STATE_MACHINE_PATH = (
+    Path(__file__).resolve().parents[2] / "knowledge" / "states" / "tv_auto_sync_states.yaml"
+)
 
 
 def load_state_machine() -> Dict[str, Any]:
-    path = Path(__file__).resolve().parents[2] / "knowledge" / "states" / "tv_auto_sync_states.yaml"
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return load_yaml_cached(STATE_MACHINE_PATH)
 
 
 def evaluate_states(matched_signatures: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -16,12 +19,15 @@ def evaluate_states(matched_signatures: List[Dict[str, Any]]) -> Dict[str, Any]:
     Infer a terminal state based on matched signatures.
     Priority: FAILURE > SUCCESS > INCONCLUSIVE.
     """
-    success_ids = {m["id"] for m in matched_signatures if m.get("category") == "SUCCESS"}
-    failure_ids = {
-        m["id"]
-        for m in matched_signatures
-        if m.get("category") not in ("SUCCESS", "INFO")
-    }
+    # One pass: every match lands in exactly one bucket (or none, for INFO).
+    success_ids = set()
+    failure_ids = set()
+    for m in matched_signatures:
+        category = m.get("category")
+        if category == "SUCCESS":
+            success_ids.add(m["id"])
+        elif category != "INFO":
+            failure_ids.add(m["id"])
 
     if failure_ids:
         terminal = "FAILURE"
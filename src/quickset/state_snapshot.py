@@ -3,14 +3,22 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 
 @dataclass
 class QuicksetStateSnapshot:
     data: Dict[str, Any]
     label: str
+    digest: str = ""
+
+
+def _state_digest(data: Dict[str, Any]) -> str:
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
 
 
 _SETTING_NAMESPACES: Iterable[str] = ("global", "secure", "system")
@@ -23,29 +31,65 @@ _STATE_KEYS = (
 )
 
 
-def _read_setting(adb_client: Any, key: str) -> Optional[str]:
-    for namespace in _SETTING_NAMESPACES:
-        try:
-            value = adb_client.run_shell(f"settings get {namespace} {key}")
-        except Exception:  # pragma: no cover
-            continue
-        if not value:
-            continue
-        lowered = value.strip().lower()
-        if lowered in {"", "null", "unknown"}:
-            continue
-        return value.strip()
-    return None
+# Marks where each namespace's 'settings list' output starts in the combined shell output.
+_SETTING_SENTINEL = "__qa_settings__"
+_EMPTY_SETTING_VALUES = frozenset({"", "null", "unknown"})
+
+
+def _read_all_settings(adb_client: Any, keys: Iterable[str]) -> Dict[str, Optional[str]]:
+    """
+    Read every key from the settings namespaces in a single adb shell round trip.
+
+    Each namespace is dumped once with 'settings list' (one settings invocation per
+    namespace rather than per key and namespace) and the keys are looked up locally.
+    For each key the first namespace with a real value wins, in _SETTING_NAMESPACES
+    order; missing/empty/"null"/"unknown" values count as missing.
+    """
+    keys = tuple(keys)
+    command = "; ".join(
+        f"echo {_SETTING_SENTINEL} {namespace}; settings list {namespace}"
+        for namespace in _SETTING_NAMESPACES
+    )
+    try:
+        output = adb_client.run_shell(command)
+    except Exception:  # pragma: no cover
+        return dict.fromkeys(keys)
+
+    dumps: Dict[str, Dict[str, List[str]]] = {}
+    current: Optional[Dict[str, List[str]]] = None
+    value_lines: Optional[List[str]] = None
+    for line in (output or "").splitlines():
+        if line.startswith(_SETTING_SENTINEL):
+            current = dumps[line[len(_SETTING_SENTINEL):].strip()] = {}
+            value_lines = None
+        elif current is not None:
+            key, sep, value = line.partition("=")
+            if sep:
+                value_lines = current[key] = [value]
+            elif value_lines is not None:  # continuation of a multi-line value
+                value_lines.append(line)
+
+    values: Dict[str, Optional[str]] = {}
+    for key in keys:
+        values[key] = None
+        for namespace in _SETTING_NAMESPACES:
+            value = "\n".join(dumps.get(namespace, {}).get(key, ())).strip()
+            if value.lower() not in _EMPTY_SETTING_VALUES:
+                values[key] = value
+                break
+    return values
 
 
 def capture_quickset_state(adb_client: Any, step_logger: Any, label: str) -> QuicksetStateSnapshot:
     """Capture a best-effort snapshot of QuickSet/volume state."""
-    snapshot_data: Dict[str, Any] = {}
-    for key in _STATE_KEYS:
-        snapshot_data[key] = _read_setting(adb_client, key)
-
-    snapshot = QuicksetStateSnapshot(snapshot_data, label)
-    step_logger.log_step("state_snapshot", "INFO", {"label": label, "data": snapshot_data})
+    snapshot_data: Dict[str, Any] = dict(_read_all_settings(adb_client, _STATE_KEYS))
+
+    snapshot = QuicksetStateSnapshot(snapshot_data, label, _state_digest(snapshot_data))
+    step_logger.log_step(
+        "state_snapshot",
+        "INFO",
+        {"label": label, "digest": snapshot.digest, "data": snapshot_data},
+    )
     return snapshot
 
 
@@ -53,28 +97,34 @@ def diff_quickset_state(
     before: QuicksetStateSnapshot,
     after: QuicksetStateSnapshot,
 ) -> Dict[str, Any]:
+    before_label = before.label if before else None
+    after_label = after.label if after else None
+    if before and after and before.digest and before.digest == after.digest:
+        return {
+            "changed": {},
+            "unchanged": sorted(before.data),
+            "missing_in_before": [],
+            "missing_in_after": [],
+            "before_label": before_label,
+            "after_label": after_label,
+        }
+
     before_data = before.data if before else {}
     after_data = after.data if after else {}
 
+    # Key-set differences give the missing sides directly; only shared keys need a
+    # value comparison. Shared keys are visited in sorted order so "changed" keeps
+    # a stable key order.
+    before_keys = before_data.keys()
+    after_keys = after_data.keys()
+    missing_in_before = sorted(after_keys - before_keys)
+    missing_in_after = sorted(before_keys - after_keys)
+
     changed: Dict[str, Dict[str, Any]] = {}
     unchanged = []
-    missing_in_before = []
-    missing_in_after = []
-
-    all_keys = set(before_data) | set(after_data)
-    for key in sorted(all_keys):
-        in_before = key in before_data
-        in_after = key in after_data
-
-        if not in_before and in_after:
-            missing_in_before.append(key)
-            continue
-        if in_before and not in_after:
-            missing_in_after.append(key)
-            continue
-
-        before_value = before_data.get(key)
-        after_value = after_data.get(key)
+    for key in sorted(before_keys & after_keys):
+        before_value = before_data[key]
+        after_value = after_data[key]
         if before_value == after_value:
             unchanged.append(key)
         else:
@@ -85,6 +135,6 @@ def diff_quickset_state(
         "unchanged": unchanged,
         "missing_in_before": missing_in_before,
         "missing_in_after": missing_in_after,
-        "before_label": before.label if before else None,
-        "after_label": after.label if after else None,
+        "before_label": before_label,
+        "after_label": after_label,
     }
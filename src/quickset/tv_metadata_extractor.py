@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence
 
-TV_BRAND_ALLOWLIST = {
+from src.quickset._log_buffer import Buffer, open_log_buffer
+
+TV_BRAND_ALLOWLIST = frozenset({
     "lg",
     "samsung",
     "sony",
@@ -15,7 +17,7 @@ TV_BRAND_ALLOWLIST = {
     "sharp",
     "toshiba",
     "vizio",
-}
+})
 
 BRAND_PATTERNS = [
     r'tvBrandName=([A-Za-z0-9 _\-]+)',
@@ -29,39 +31,57 @@ MODEL_PATTERNS = [
     r'"model":"([^"]+)"',
 ]
 
-INVALID_SUBSTRINGS = {"partnertv", "partnerrc", "stb", "box", "quickset"}
+INVALID_SUBSTRINGS = ("partnertv", "partnerrc", "stb", "box", "quickset")
+
+# Compiled once, as bytes patterns so they run directly over the mmapped log. Kept
+# as separate patterns (not one alternation) because they are priority-ordered: a
+# later pattern only counts if every earlier one is absent.
+_BRAND_RES = tuple(re.compile(p.encode(), re.IGNORECASE) for p in BRAND_PATTERNS)
+_MODEL_RES = tuple(re.compile(p.encode(), re.IGNORECASE) for p in MODEL_PATTERNS)
 
 
 def _looks_like_tv_brand(value: str) -> bool:
     lower = value.lower()
-    if any(token in lower for token in INVALID_SUBSTRINGS):
-        return False
+    # The set lookup rejects almost every non-brand on its own; the substring scan
+    # only matters when the allowlist is empty or gains an entry containing a token.
     if TV_BRAND_ALLOWLIST and lower not in TV_BRAND_ALLOWLIST:
         return False
-    return True
+    return not any(token in lower for token in INVALID_SUBSTRINGS)
 
 
-def _search_first(text: str, patterns: list[str]) -> Optional[str]:
+def _search_first(data: Buffer, patterns: Sequence[re.Pattern[bytes]]) -> Optional[str]:
     for pattern in patterns:
-        match = re.search(pattern, text, flags=re.IGNORECASE)
+        match = pattern.search(data)
         if match:
-            value = match.group(1).strip()
+            value = match.group(1).decode("utf-8", errors="ignore").strip()
             if value:
                 return value
     return None
 
 
-def extract_tv_metadata_from_log(log_path: Path) -> Dict[str, Optional[str]]:
-    """Parse log text and return detected brand/model information."""
+def extract_tv_metadata_from_log(
+    log_path: Path, log_buffer: Optional[Buffer] = None
+) -> Dict[str, Optional[str]]:
+    """
+    Parse log text and return detected brand/model information.
+
+    log_buffer is the already-mapped contents of log_path (see open_log_buffer);
+    when omitted the file is mapped here.
+    """
     if not log_path.exists():
         return {"tv_brand_logs": None, "tv_model_logs": None}
+    if log_buffer is None:
+        with open_log_buffer(log_path) as mapped:
+            return extract_tv_metadata_from_log(log_path, b"" if mapped is None else mapped)
+
+    # Searched in place: only the pages the regexes touch are read, nothing is decoded
+    # except the captured values.
+    brand = _search_first(log_buffer, _BRAND_RES)
+    model = _search_first(log_buffer, _MODEL_RES)
 
-    text = log_path.read_text(encoding="utf-8", errors="ignore")
-    brand = _search_first(text, BRAND_PATTERNS)
     if brand and not _looks_like_tv_brand(brand):
         brand = None
 
-    model = _search_first(text, MODEL_PATTERNS)
     if model and any(token in model.lower() for token in INVALID_SUBSTRINGS):
         model = None
 
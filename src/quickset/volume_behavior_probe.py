@@ -2,14 +2,31 @@
 from __future__ import annotations
 
 import re
+import sys
+from bisect import bisect_left
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import yaml
+from src.quickset._log_buffer import Buffer, open_log_buffer, present_needles
+from src.quickset._yaml_cache import load_yaml_cached
 
 
-@dataclass
+def _innermost_needles(markers: Iterable[str]) -> Tuple[bytes, ...]:
+    markers = tuple(markers)
+    return tuple(
+        marker.encode("utf-8")
+        for marker in markers
+        if not any(other != marker and other in marker for other in markers)
+    )
+
+
+# dataclass(slots=True) is Python 3.10+; older interpreters get a regular dataclass.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class VolumeProbeSignals:
     """
     Internal helper structure describing what we found in the logs.
@@ -40,12 +57,26 @@ class VolumeBehaviorProbe:
       plus extra metadata keys that the analyzer may ignore safely.
     """
 
-    # Patterns that extract numeric volume_source codes from log lines
+    # Patterns that extract numeric volume_source codes from log lines. They are
+    # matched case-sensitively against the lowercased line, so keep them lowercase.
+    # A pattern may match with an empty group; such matches carry no code.
     VOLUME_PATTERNS: List[str] = [
         r'"volume_source":\s*(\d+)',
-        r'curVolSource:\s*(\d+)',
-        r'current_volume_source.*value:(\d+)',
+        r'curvolsource:\s*(\d+)',
+        # The greedy .* takes the last value: on the line. When there is none, the
+        # |.* branch consumes the rest of the line, so the scan is not retried at
+        # every later current_volume_source (quadratic on long lines).
+        r'current_volume_source(?:.*value:(\d+)|.*)',
     ]
+    # Compiled once, applied in VOLUME_PATTERNS order so the order (and overlap) of
+    # extracted codes is exactly what per-pattern findall gives.
+    _VOLUME_RES: Tuple[re.Pattern[str], ...] = tuple(re.compile(p) for p in VOLUME_PATTERNS)
+    # Every VOLUME_PATTERNS entry contains this; lines without it cannot match and
+    # skip the regex scans. Keep in sync when adding patterns.
+    _VOLUME_KEYWORD: bytes = b"vol"
+    # The literal each VOLUME_PATTERNS entry (same position) requires; on a
+    # candidate line a pattern only runs if its literal is present.
+    _VOLUME_LITERALS: Tuple[str, ...] = ('"volume_source":', "curvolsource:", "current_volume_source")
 
     # Markers that indicate QuickSet / TV auto-sync context in logs
     QUICKSET_MARKERS: List[str] = [
@@ -57,6 +88,8 @@ class VolumeBehaviorProbe:
         "tv_auto_sync",
         "TvAutoSync",
     ]
+    # Markers that contain another marker add nothing to a "line has a marker" test.
+    _MARKER_NEEDLES: Tuple[bytes, ...] = _innermost_needles(QUICKSET_MARKERS)
 
     # Mapping from numeric code to semantic source
     SOURCE_MAP: Dict[int, str] = {
@@ -70,11 +103,35 @@ class VolumeBehaviorProbe:
     # When searching around QuickSet markers, how many lines back we keep as context
     QUICKSET_CONTEXT_LINES: int = 150
 
-    def __init__(self, adb_client: Any, log_path: Path, knowledge_root: Path) -> None:
+    # Block size used when reading the log tail backwards from the end of the file
+    TAIL_READ_CHUNK: int = 64 * 1024
+
+    def __init__(
+        self,
+        adb_client: Any,
+        log_path: Path,
+        knowledge_root: Path,
+        log_buffer: Optional[Buffer] = None,
+    ) -> None:
         self.adb = adb_client
         self.log_path = log_path
         self.knowledge_root = knowledge_root
+        # Contents of log_path already mapped by the caller (see open_log_buffer);
+        # None means the probe maps the file itself.
+        self.log_buffer = log_buffer
         self.signatures = self._load_signatures()
+        self._last_state_key: Optional[Tuple[int, int]] = None
+        self._last_signals: Optional[VolumeProbeSignals] = None
+        # (encoded pattern, result entry) per signature, built once per probe; a hit
+        # appends the prepared entry instead of assembling a new dict.
+        self._signature_needles: List[Tuple[bytes, Dict[str, str]]] = [
+            (
+                sig["pattern"].encode("utf-8"),
+                {"id": sig.get("id"), "category": sig.get("category"), "severity": sig.get("severity")},
+            )
+            for sig in self.signatures
+            if sig.get("pattern")
+        ]
 
     # -------------------------------------------------------------------------
     # I/O helpers
@@ -82,15 +139,51 @@ class VolumeBehaviorProbe:
 
     def _load_signatures(self) -> List[Dict[str, str]]:
         path = self.knowledge_root / "signatures" / "volume_behavior.yaml"
-        if not path.exists():
+        try:
+            return load_yaml_cached(path).get("signatures", [])
+        except FileNotFoundError:
             return []
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-        return data.get("signatures", [])
 
-    def _read_log_text(self) -> str:
-        if not self.log_path.exists():
-            return ""
-        return self.log_path.read_text(encoding="utf-8", errors="ignore")
+    def _log_state_key(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the log, or None when it cannot be stat'ed."""
+        try:
+            st = self.log_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    @contextmanager
+    def _log_contents(self) -> Iterator[Optional[Buffer]]:
+        """Yield the shared log buffer, or map log_path for the block (None if missing)."""
+        if self.log_buffer is not None:
+            yield self.log_buffer
+            return
+        with open_log_buffer(self.log_path) as mapped:
+            yield mapped
+
+    def _read_tail_text(self, max_lines: int) -> str:
+        """
+        Return the end of the log, decoded, holding at least its last max_lines lines.
+
+        Reads backwards in TAIL_READ_CHUNK blocks until more than max_lines newlines
+        are buffered, so only the tail is read instead of the whole capture. Only the
+        first (possibly partial) line can differ from a full read, and _tail_lines
+        drops it.
+        """
+        chunks: List[bytes] = []
+        with self._log_contents() as log_buffer:
+            if not log_buffer:
+                return ""
+            newlines = 0
+            pos = len(log_buffer)
+            while pos > 0 and newlines <= max_lines:
+                start = max(pos - self.TAIL_READ_CHUNK, 0)
+                chunk = log_buffer[start:pos]
+                newlines += chunk.count(b"\n")
+                chunks.append(chunk)
+                pos = start
+        chunks.reverse()
+        return b"".join(chunks).decode("utf-8", errors="ignore")
 
     # -------------------------------------------------------------------------
     # Parsing helpers
@@ -105,46 +198,64 @@ class VolumeBehaviorProbe:
             return lines
         return lines[-max_lines:]
 
-    def _match_signatures(self, text: str) -> List[Dict[str, str]]:
+    def _match_signatures(self) -> List[Dict[str, str]]:
+        """Match signatures against the whole log, searched in place."""
         matches: List[Dict[str, str]] = []
-        for sig in self.signatures:
-            pattern = sig.get("pattern")
-            if pattern and pattern in text:
-                matches.append(
-                    {
-                        "id": sig.get("id"),
-                        "category": sig.get("category"),
-                        "severity": sig.get("severity"),
-                    }
-                )
+        if not self._signature_needles:
+            return matches
+        with self._log_contents() as log_buffer:
+            if not log_buffer:
+                return matches
+            present = present_needles(log_buffer, [needle for needle, _ in self._signature_needles])
+            for index, (_, entry) in enumerate(self._signature_needles):
+                if index in present:
+                    matches.append(entry)
         return matches
 
+    @staticmethod
+    def _line_indices_containing(buf: bytes, needles: Iterable[bytes]) -> List[int]:
+        """
+        Return the ascending indices of the newline-separated lines of buf that
+        contain at least one of the needles (none of which may contain a newline).
+
+        Each needle is located with bytes.find over the whole buffer; after a hit the
+        search resumes at the next line, and newlines are only counted up to hits.
+        """
+        hits = set()
+        find = buf.find
+        for needle in needles:
+            pos = find(needle)
+            last = 0
+            line = 0
+            while pos != -1:
+                line += buf.count(b"\n", last, pos)
+                hits.add(line)
+                next_break = find(b"\n", pos)
+                if next_break == -1:
+                    break
+                last = pos
+                pos = find(needle, next_break + 1)
+        return sorted(hits)
+
     def _iter_volume_matches(
-        self, lines: Iterable[str]
+        self, lines: List[str], candidates: Iterable[int]
     ) -> Iterable[Tuple[int, str, int]]:
         """
         Yield (line_index, pattern, numeric_code) for every volume_source code
-        found in the given lines.
-        """
-        for idx, line in enumerate(lines):
-            for pattern in self.VOLUME_PATTERNS:
-                for match in re.findall(pattern, line, flags=re.IGNORECASE):
-                    try:
-                        code = int(match)
-                    except ValueError:
-                        continue
-                    yield idx, pattern, code
-
-    def _closest_quickset_context_indices(self, lines: List[str]) -> List[int]:
-        """
-        Return indices of lines that contain QuickSet / TV_AUTO_SYNC markers.
-        Used as anchors for contextual search.
+        found in the candidate lines (ascending indices into lines).
         """
-        anchor_indices: List[int] = []
-        for idx, line in enumerate(lines):
-            if any(marker in line for marker in self.QUICKSET_MARKERS):
-                anchor_indices.append(idx)
-        return anchor_indices
+        guarded = tuple(zip(self._VOLUME_LITERALS, self._VOLUME_RES))
+        for idx in candidates:
+            # One lower() per line instead of IGNORECASE folding inside every scan.
+            lowered = lines[idx].lower()
+            for literal, regex in guarded:
+                if literal not in lowered:
+                    continue
+                pattern = regex.pattern
+                # Every pattern captures a single \d+ group, which int() always accepts.
+                for match in regex.findall(lowered):
+                    if match:
+                        yield idx, pattern, int(match)
 
     def _select_best_code_from_tail(self, text: str) -> VolumeProbeSignals:
         """
@@ -162,11 +273,20 @@ class VolumeBehaviorProbe:
         signals.lines_scanned = len(tail_lines)
         signals.context_window_size = self.QUICKSET_CONTEXT_LINES
 
+        # Markers and the volume keyword never span lines, so both are located by
+        # scanning the rejoined tail as one bytes buffer instead of line by line.
+        tail_buf = "\n".join(tail_lines).encode("utf-8")
+
         # Pre-compute QuickSet anchor positions
-        anchor_indices = self._closest_quickset_context_indices(tail_lines)
+        anchor_indices = self._line_indices_containing(tail_buf, self._MARKER_NEEDLES)
 
         # Gather all volume matches in the tail
-        all_matches: List[Tuple[int, str, int]] = list(self._iter_volume_matches(tail_lines))
+        volume_lines = self._line_indices_containing(
+            tail_buf.lower(), (self._VOLUME_KEYWORD,)
+        )
+        all_matches: List[Tuple[int, str, int]] = list(
+            self._iter_volume_matches(tail_lines, volume_lines)
+        )
         if all_matches:
             signals.recent_volume_sources = [
                 self.SOURCE_MAP.get(code, "UNKNOWN") for _, _, code in all_matches[-10:]
@@ -182,14 +302,13 @@ class VolumeBehaviorProbe:
         #    of a QuickSet anchor.
         contextual_matches: List[Tuple[int, str, int]] = []
         if anchor_indices:
-            anchor_set = set(anchor_indices)
+            # anchor_indices is ascending, so the first anchor at or after
+            # idx - window is the only one that can be within the window.
+            window = self.QUICKSET_CONTEXT_LINES
+            anchor_count = len(anchor_indices)
             for idx, pattern, code in all_matches:
-                # Find any anchor within context window
-                in_context = any(
-                    abs(idx - anchor_idx) <= self.QUICKSET_CONTEXT_LINES
-                    for anchor_idx in anchor_set
-                )
-                if in_context:
+                pos = bisect_left(anchor_indices, idx - window)
+                if pos < anchor_count and anchor_indices[pos] <= idx + window:
                     contextual_matches.append((idx, pattern, code))
 
         chosen_match: Tuple[int, str, int]
@@ -259,16 +378,20 @@ class VolumeBehaviorProbe:
             {"instruction": instruction, "tester_visible": False},
         )
 
-        log_text = self._read_log_text()
-        matched_signatures = self._match_signatures(log_text)
-
-        signals = self._select_best_code_from_tail(log_text)
-        signals.matched_signatures = matched_signatures
+        # A repeat run over an unchanged log (same mtime and size) reuses the last scan.
+        state_key = self._log_state_key()
+        if state_key is not None and state_key == self._last_state_key:
+            signals = self._last_signals
+        else:
+            matched_signatures = self._match_signatures()
+            signals = self._select_best_code_from_tail(self._read_tail_text(self.DEFAULT_TAIL_LINES))
+            signals.matched_signatures = matched_signatures
+            self._last_state_key, self._last_signals = state_key, signals
 
         result: Dict[str, Any] = {
             "volume_source": signals.volume_source,
             "confidence": signals.confidence,
-            "matched_signatures": signals.matched_signatures or [],
+            "matched_signatures": list(signals.matched_signatures or ()),
             "raw_code": signals.raw_code,
             # extra, non-breaking debug/trace fields:
             "source_reason": signals.source_reason,
@@ -276,7 +399,7 @@ class VolumeBehaviorProbe:
             "context_window_size": signals.context_window_size,
         }
         if signals.recent_volume_sources:
-            result["volume_source_window"] = signals.recent_volume_sources
+            result["volume_source_window"] = list(signals.recent_volume_sources)
 
         step_logger.log_step("volume_probe_result", "INFO", result)
         return result
@@ -0,0 +1,7 @@
+"""Shared pytest setup for the top-level tests."""
+
+from pathlib import Path
+import sys
+
+# Make the repository root importable so tests can use `from src... import ...`.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
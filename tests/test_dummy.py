@@ -1,12 +1,8 @@
 """Basic smoke tests for shared utilities."""
 
-from pathlib import Path
 import json
-import sys
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
-from src.qa.step_logger import StepLogger  # noqa: E402  (import after path tweak)
+from src.qa.step_logger import StepLogger
 
 
 def test_step_logger_records_entries(tmp_path) -> None:
@@ -23,3 +19,14 @@ def test_step_logger_records_entries(tmp_path) -> None:
     assert entry["step_name"] == "example"
     assert entry["status"] == "PASS"
     assert entry["details"]["note"] == "sample"
+
+
+def test_step_logger_entries_visible_before_close(tmp_path) -> None:
+    """The backend reads the log mid-session, so every step must reach the file."""
+    logger = StepLogger("open-session", tmp_path)
+    logger.log_step("example", "INFO", {"note": "sample"})
+
+    content = (tmp_path / "open-session.jsonl").read_text(encoding="utf-8").splitlines()
+    logger.close()
+    assert len(content) == 1
+    assert json.loads(content[0])["step_name"] == "example"